@@ -9,6 +9,7 @@ deleted or only hold the package related custom element classes.
 
 from __future__ import annotations
 
+import functools
 from typing import cast
 
 from lxml import etree
@@ -27,6 +28,11 @@ nsmap = {
     "r": NS.OFC_RELATIONSHIPS,
 }
 
+# -- Clark-notation tags, computed once for element construction and child access --
+_DEFAULT_TAG = "{%s}Default" % nsmap["ct"]
+_OVERRIDE_TAG = "{%s}Override" % nsmap["ct"]
+_RELATIONSHIP_TAG = "{%s}Relationship" % nsmap["pr"]
+
 
 # ===========================================================================
 # functions
@@ -38,16 +44,18 @@ def parse_xml(text: str) -> etree._Element:
     return etree.fromstring(text, oxml_parser)
 
 
+@functools.lru_cache(maxsize=None)
 def qn(tag):
     """Stands for "qualified name", a utility function to turn a namespace prefixed tag
     name into a Clark-notation qualified tag name for lxml.
 
     For
-    example, ``qn('p:cSld')`` returns ``'{http://schemas.../main}cSld'``.
+    example, ``qn('p:cSld')`` returns ``'{http://schemas.../main}cSld'``. Results are
+    cached; the set of distinct tags is small and bounded by the schema.
     """
     prefix, tagroot = tag.split(":")
     uri = nsmap[prefix]
-    return "{%s}%s" % (uri, tagroot)
+    return f"{{{uri}}}{tagroot}"
 
 
 def serialize_part_xml(part_elm: etree._Element):
@@ -104,11 +112,11 @@ class CT_Default(BaseOxmlElement):
     def new(ext, content_type):
         """Return a new ``<Default>`` element with attributes set to parameter
         values."""
-        xml = '<Default xmlns="%s"/>' % nsmap["ct"]
-        default = parse_xml(xml)
-        default.set("Extension", ext)
-        default.set("ContentType", content_type)
-        return default
+        return oxml_parser.makeelement(
+            _DEFAULT_TAG,
+            {"Extension": ext, "ContentType": content_type},
+            nsmap={None: nsmap["ct"]},
+        )
 
 
 class CT_Override(BaseOxmlElement):
@@ -125,11 +133,11 @@ class CT_Override(BaseOxmlElement):
     def new(partname, content_type):
         """Return a new ``<Override>`` element with attributes set to parameter
         values."""
-        xml = '<Override xmlns="%s"/>' % nsmap["ct"]
-        override = parse_xml(xml)
-        override.set("PartName", partname)
-        override.set("ContentType", content_type)
-        return override
+        return oxml_parser.makeelement(
+            _OVERRIDE_TAG,
+            {"PartName": partname, "ContentType": content_type},
+            nsmap={None: nsmap["ct"]},
+        )
 
     @property
     def partname(self):
@@ -144,14 +152,10 @@ class CT_Relationship(BaseOxmlElement):
     @staticmethod
     def new(rId: str, reltype: str, target: str, target_mode: str = RTM.INTERNAL):
         """Return a new ``<Relationship>`` element."""
-        xml = '<Relationship xmlns="%s"/>' % nsmap["pr"]
-        relationship = parse_xml(xml)
-        relationship.set("Id", rId)
-        relationship.set("Type", reltype)
-        relationship.set("Target", target)
+        attrs = {"Id": rId, "Type": reltype, "Target": target}
         if target_mode == RTM.EXTERNAL:
-            relationship.set("TargetMode", RTM.EXTERNAL)
-        return relationship
+            attrs["TargetMode"] = RTM.EXTERNAL
+        return oxml_parser.makeelement(_RELATIONSHIP_TAG, attrs, nsmap={None: nsmap["pr"]})
 
     @property
     def rId(self):
@@ -198,7 +202,7 @@ class CT_Relationships(BaseOxmlElement):
     @property
     def Relationship_lst(self):
         """Return a list containing all the ``<Relationship>`` child elements."""
-        return self.findall(qn("pr:Relationship"))
+        return list(self.iterchildren(_RELATIONSHIP_TAG))
 
     @property
     def xml(self):
@@ -224,7 +228,7 @@ class CT_Types(BaseOxmlElement):
 
     @property
     def defaults(self):
-        return self.findall(qn("ct:Default"))
+        return list(self.iterchildren(_DEFAULT_TAG))
 
     @staticmethod
     def new():
@@ -235,7 +239,7 @@ class CT_Types(BaseOxmlElement):
 
     @property
     def overrides(self):
-        return self.findall(qn("ct:Override"))
+        return list(self.iterchildren(_OVERRIDE_TAG))
 
 
 ct_namespace = element_class_lookup.get_namespace(nsmap["ct"])
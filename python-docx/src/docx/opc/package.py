@@ -28,6 +28,8 @@ class OpcPackage:
 
     def __init__(self):
         super(OpcPackage, self).__init__()
+        # -- lowest numeric suffix not yet known to be in use, keyed by partname template --
+        self._next_partname_idxs: dict[str, int] = {}
 
     def after_unmarshal(self):
         """Entry point for any post-unmarshaling processing.
@@ -46,46 +48,49 @@ class OpcPackage:
 
     def iter_rels(self) -> Iterator[_Relationship]:
         """Generate exactly one reference to each relationship in the package by
-        performing a depth-first traversal of the rels graph."""
-
-        def walk_rels(
-            source: OpcPackage | Part, visited: list[Part] | None = None
-        ) -> Iterator[_Relationship]:
-            visited = [] if visited is None else visited
-            for rel in source.rels.values():
-                yield rel
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
-                new_source = part
-                for rel in walk_rels(new_source, visited):
-                    yield rel
-
-        for rel in walk_rels(self):
+        performing a depth-first traversal of the rels graph.
+
+        The traversal uses an explicit stack of rels iterators rather than recursion, so
+        no generator is created per level and graph depth is not limited by the
+        recursion limit. Order is the same as a recursive depth-first walk.
+        """
+        visited: set[Part] = set()
+        stack: list[Iterator[_Relationship]] = [iter(self.rels.values())]
+        while stack:
+            rel = next(stack[-1], None)
+            if rel is None:
+                stack.pop()
+                continue
             yield rel
+            if rel.is_external:
+                continue
+            part = rel.target_part
+            if part in visited:
+                continue
+            visited.add(part)
+            stack.append(iter(part.rels.values()))
 
     def iter_parts(self) -> Iterator[Part]:
         """Generate exactly one reference to each of the parts in the package by
-        performing a depth-first traversal of the rels graph."""
-
-        def walk_parts(source, visited=[]):
-            for rel in source.rels.values():
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
-                yield part
-                new_source = part
-                for part in walk_parts(new_source, visited):
-                    yield part
-
-        for part in walk_parts(self):
+        performing a depth-first traversal of the rels graph.
+
+        Like :meth:`iter_rels`, this walks the graph iteratively with an explicit stack.
+        """
+        visited: set[Part] = set()
+        stack: list[Iterator[_Relationship]] = [iter(self.rels.values())]
+        while stack:
+            rel = next(stack[-1], None)
+            if rel is None:
+                stack.pop()
+                continue
+            if rel.is_external:
+                continue
+            part = rel.target_part
+            if part in visited:
+                continue
+            visited.add(part)
             yield part
+            stack.append(iter(part.rels.values()))
 
     def load_rel(self, reltype: str, target: Part | str, rId: str, is_external: bool = False):
         """Return newly added |_Relationship| instance of `reltype` between this part
@@ -95,15 +100,19 @@ class OpcPackage:
         use during load from a serialized package, where the rId is well known. Other
         methods exist for adding a new relationship to the package during processing.
         """
-        return self.rels.add_relationship(reltype, target, rId, is_external)
+        rel = self.rels.add_relationship(reltype, target, rId, is_external)
+        if not is_external:
+            self.partnames_changed(cast("Part", target))
+        return rel
 
-    @property
+    @lazyproperty
     def main_document_part(self):
         """Return a reference to the main document part for this package.
 
         Examples include a document part for a WordprocessingML package, a presentation
         part for a PresentationML package, or a workbook part for a SpreadsheetML
-        package.
+        package. The part is looked up once and cached; the cache is reset when a new
+        office-document relationship is added with :meth:`relate_to`.
         """
         return self.part_related_by(RT.OFFICE_DOCUMENT)
 
@@ -114,19 +123,44 @@ class OpcPackage:
         from other parts of its type. `template` is a printf (%)-style template string
         containing a single replacement item, a '%d' to be used to insert the integer
         portion of the partname. Example: "/word/header%d.xml"
+
+        The package is walked only on the first call to collect the partnames in use.
+        Each partname returned is added to that collection, so a partname is never
+        issued twice. The collection is gathered again after :meth:`partnames_changed`
+        reports a change to the part graph it cannot account for.
+        """
+        partnames = self._partnames
+        n = self._next_partname_idxs.get(template, 1)
+        while template % n in partnames:
+            n += 1
+        partname = PackURI(template % n)
+        partnames.add(partname)
+        self._next_partname_idxs[template] = n + 1
+        return partname
+
+    def partnames_changed(self, part: Part | None = None):
+        """Note that a relationship between parts of this package was added or dropped.
+
+        `part` is the target of an added relationship. When its partname is already
+        known, as for a part named by :meth:`next_partname`, the partnames gathered for
+        that method are still accurate and are kept. Otherwise they are discarded, to be
+        gathered again on next use.
         """
-        partnames = {part.partname for part in self.iter_parts()}
-        for n in range(1, len(partnames) + 2):
-            candidate_partname = template % n
-            if candidate_partname not in partnames:
-                return PackURI(candidate_partname)
+        partnames = self.__dict__.get("_partnames")
+        if partnames is None or (part is not None and part.partname in partnames):
+            return
+        del self.__dict__["_partnames"]
+        self._next_partname_idxs.clear()
 
     @classmethod
     def open(cls, pkg_file: str | IO[bytes]) -> OpcPackage:
         """Return an |OpcPackage| instance loaded with the contents of `pkg_file`."""
         pkg_reader = PackageReader.from_file(pkg_file)
         package = cls()
-        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        try:
+            Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        finally:
+            pkg_reader.close()
         return package
 
     def part_related_by(self, reltype: str) -> Part:
@@ -149,6 +183,9 @@ class OpcPackage:
         new relationship is created and that rId is returned.
         """
         rel = self.rels.get_or_add(reltype, part)
+        self.partnames_changed(part)
+        if reltype == RT.OFFICE_DOCUMENT:
+            self.__dict__.pop("main_document_part", None)
         return rel.rId
 
     @lazyproperty
@@ -162,15 +199,22 @@ class OpcPackage:
 
         `pkg_file` can be either a file-path or a file-like object.
         """
-        for part in self.parts:
+        parts = self.parts
+        for part in parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        PackageWriter.write(pkg_file, self.rels, parts)
 
-    @property
+    @lazyproperty
+    def _partnames(self) -> set[str]:
+        """Partnames in use in this package, gathered by walking the rels graph once."""
+        return {part.partname for part in self.iter_parts()}
+
+    @lazyproperty
     def _core_properties_part(self) -> CorePropertiesPart:
         """|CorePropertiesPart| object related to this package.
 
-        Creates a default core properties part if one is not present (not common).
+        Creates a default core properties part if one is not present (not common). The
+        part found or created is cached, so later access does not search the rels again.
         """
         try:
             return cast(CorePropertiesPart, self.part_related_by(RT.CORE_PROPERTIES))
@@ -213,8 +257,16 @@ class Unmarshaller:
     def _unmarshal_relationships(pkg_reader, package, parts):
         """Add a relationship to the source object corresponding to each of the
         relationships in `pkg_reader` with its target_part set to the actual target part
-        in `parts`."""
+        in `parts`.
+
+        Relationships arrive grouped by source, so the source is only resolved when
+        `source_uri` changes.
+        """
+        prev_source_uri = source = None
         for source_uri, srel in pkg_reader.iter_srels():
-            source = package if source_uri == "/" else parts[source_uri]
-            target = srel.target_ref if srel.is_external else parts[srel.target_partname]
-            source.load_rel(srel.reltype, target, srel.rId, srel.is_external)
+            if source_uri != prev_source_uri:
+                source = package if source_uri == "/" else parts[source_uri]
+                prev_source_uri = source_uri
+            is_external = srel.is_external
+            target = srel.target_ref if is_external else parts[srel.target_partname]
+            source.load_rel(srel.reltype, target, srel.rId, is_external)
@@ -7,22 +7,36 @@ from __future__ import annotations
 
 import posixpath
 import re
+import weakref
+
+from docx.shared import lazyproperty
+
+_filename_re = re.compile("([a-zA-Z]+)([1-9][0-9]*)?")
+
+# -- live PackURI instances by value; an entry disappears when its PackURI is collected --
+_interned: weakref.WeakValueDictionary[str, PackURI] = weakref.WeakValueDictionary()
 
 
 class PackURI(str):
     """Provides access to pack URI components such as the baseURI and the filename
     slice.
 
-    Behaves as |str| otherwise.
+    Behaves as |str| otherwise. Since a str is immutable, components derived from it
+    are computed on first access and cached. Instances are interned, so constructing a
+    PackURI equal to one still in use returns that same instance, along with whatever it
+    has already computed.
     """
 
-    _filename_re = re.compile("([a-zA-Z]+)([1-9][0-9]*)?")
-
     def __new__(cls, pack_uri_str: str):
+        pack_uri = _interned.get(pack_uri_str)
+        if pack_uri is not None and type(pack_uri) is cls:
+            return pack_uri
         if pack_uri_str[0] != "/":
             tmpl = "PackURI must begin with slash, got '%s'"
             raise ValueError(tmpl % pack_uri_str)
-        return str.__new__(cls, pack_uri_str)
+        pack_uri = str.__new__(cls, pack_uri_str)
+        _interned[pack_uri_str] = pack_uri
+        return pack_uri
 
     @staticmethod
     def from_rel_ref(baseURI: str, relative_ref: str) -> PackURI:
@@ -31,7 +45,7 @@ class PackURI(str):
         abs_uri = posixpath.abspath(joined_uri)
         return PackURI(abs_uri)
 
-    @property
+    @lazyproperty
     def baseURI(self) -> str:
         """The base URI of this pack URI, the directory portion, roughly speaking.
 
@@ -40,7 +54,7 @@ class PackURI(str):
         """
         return posixpath.split(self)[0]
 
-    @property
+    @lazyproperty
     def ext(self) -> str:
         """The extension portion of this pack URI, e.g. ``'xml'`` for ``'/word/document.xml'``.
 
@@ -50,8 +64,8 @@ class PackURI(str):
         raw_ext = posixpath.splitext(self)[1]
         return raw_ext[1:] if raw_ext.startswith(".") else raw_ext
 
-    @property
-    def filename(self):
+    @lazyproperty
+    def filename(self) -> str:
         """The "filename" portion of this pack URI, e.g. ``'slide1.xml'`` for
         ``'/ppt/slides/slide1.xml'``.
 
@@ -59,8 +73,8 @@ class PackURI(str):
         """
         return posixpath.split(self)[1]
 
-    @property
-    def idx(self):
+    @lazyproperty
+    def idx(self) -> int | None:
         """Return partname index as integer for tuple partname or None for singleton
         partname, e.g. ``21`` for ``'/ppt/slides/slide21.xml'`` and |None| for
         ``'/ppt/presentation.xml'``."""
@@ -68,15 +82,15 @@ class PackURI(str):
         if not filename:
             return None
         name_part = posixpath.splitext(filename)[0]  # filename w/ext removed
-        match = self._filename_re.match(name_part)
+        match = _filename_re.match(name_part)
         if match is None:
             return None
         if match.group(2):
             return int(match.group(2))
         return None
 
-    @property
-    def membername(self):
+    @lazyproperty
+    def membername(self) -> str:
         """The pack URI with the leading slash stripped off, the form used as the Zip
         file membername for the package item.
 
@@ -92,10 +106,35 @@ class PackURI(str):
         """
         # workaround for posixpath bug in 2.6, doesn't generate correct
         # relative path when `start` (second) parameter is root ('/')
-        return self[1:] if baseURI == "/" else posixpath.relpath(self, baseURI)
-
-    @property
-    def rels_uri(self):
+        if baseURI == "/":
+            return self[1:]
+        # -- the shortcuts below only hold for a normalized absolute `baseURI`, one with no
+        # -- trailing slash, empty segment or "."/".." segment --
+        if (
+            not baseURI.startswith("/")
+            or baseURI.endswith("/")
+            or "//" in baseURI
+            or "/." in baseURI
+        ):
+            return posixpath.relpath(self, baseURI)
+        # -- common case, target is at or below `baseURI` --
+        base_len = len(baseURI)
+        if self.startswith(baseURI) and self[base_len : base_len + 1] == "/":
+            return self[base_len + 1 :]
+        # -- otherwise strip the common leading segments and climb out of what remains of
+        # -- `baseURI`; no need for the normalization `posixpath.relpath()` performs
+        base_segs = baseURI[1:].split("/")
+        segs = self[1:].split("/")
+        i = 0
+        for base_seg, seg in zip(base_segs, segs):
+            if base_seg != seg:
+                break
+            i += 1
+        rel_segs = [".."] * (len(base_segs) - i) + segs[i:]
+        return "/".join(rel_segs) if rel_segs else "."
+
+    @lazyproperty
+    def rels_uri(self) -> PackURI:
         """The pack URI of the .rels part corresponding to the current pack URI.
 
         Only produces sensible output if the pack URI is a partname or the package
@@ -6,10 +6,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Callable, Type, cast
 
+from lxml import etree
+
 from docx.opc.oxml import serialize_part_xml
 from docx.opc.packuri import PackURI
 from docx.opc.rel import Relationships
-from docx.opc.shared import cls_method_fn
+from docx.oxml.ns import qn
 from docx.oxml.parser import parse_xml
 from docx.shared import lazyproperty
 
@@ -17,6 +19,8 @@ if TYPE_CHECKING:
     from docx.oxml.xmlchemy import BaseOxmlElement
     from docx.package import Package
 
+_R_ID = qn("r:id")
+
 
 class Part:
     """Base class for package parts.
@@ -80,6 +84,8 @@ class Part:
         """
         if self._rel_ref_count(rId) < 2:
             del self.rels[rId]
+            if self._package is not None:
+                self._package.partnames_changed()
 
     @classmethod
     def load(cls, partname: PackURI, content_type: str, blob: bytes, package: Package):
@@ -94,7 +100,10 @@ class Part:
         use during load from a serialized package, where the rId is well-known. Other
         methods exist for adding a new relationship to a part when manipulating a part.
         """
-        return self.rels.add_relationship(reltype, target, rId, is_external)
+        rel = self.rels.add_relationship(reltype, target, rId, is_external)
+        if not is_external and self._package is not None:
+            self._package.partnames_changed(cast(Part, target))
+        return rel
 
     @property
     def package(self):
@@ -133,6 +142,8 @@ class Part:
             return self.rels.get_or_add_ext_rel(reltype, cast(str, target))
         else:
             rel = self.rels.get_or_add(reltype, cast(Part, target))
+            if self._package is not None:
+                self._package.partnames_changed(cast(Part, target))
             return rel.rId
 
     @property
@@ -188,8 +199,8 @@ class PartFactory:
         package: Package,
     ):
         PartClass: Type[Part] | None = None
-        if cls.part_class_selector is not None:
-            part_class_selector = cls_method_fn(cls, "part_class_selector")
+        part_class_selector = cls.part_class_selector
+        if part_class_selector is not None:
             PartClass = part_class_selector(content_type, reltype)
         if PartClass is None:
             PartClass = cls._part_cls_for(content_type)
@@ -199,9 +210,7 @@ class PartFactory:
     def _part_cls_for(cls, content_type: str):
         """Return the custom part class registered for `content_type`, or the default
         part class if no custom class is registered for `content_type`."""
-        if content_type in cls.part_type_for:
-            return cls.part_type_for[content_type]
-        return cls.default_part_type
+        return cls.part_type_for.get(content_type, cls.default_part_type)
 
 
 class XmlPart(Part):
@@ -242,6 +251,15 @@ class XmlPart(Part):
 
     def _rel_ref_count(self, rId: str) -> int:
         """Return the count of references in this part's XML to the relationship
-        identified by `rId`."""
-        rIds = cast("list[str]", self._element.xpath("//@r:id"))
-        return len([_rId for _rId in rIds if _rId == rId])
+        identified by `rId`.
+
+        Counting stops at 2 because callers only need to distinguish a single reference
+        from multiple ones; this avoids a full-tree scan when `rId` is widely shared.
+        """
+        count = 0
+        for e in self._element.iter(etree.Element):
+            if e.get(_R_ID) == rId:
+                count += 1
+                if count > 1:
+                    break
+        return count
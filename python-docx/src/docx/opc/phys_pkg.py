@@ -1,10 +1,27 @@
 """Provides a general interface to a `physical` OPC package, such as a zip file."""
 
+import io
 import os
-from zipfile import ZIP_DEFLATED, ZipFile, is_zipfile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, is_zipfile
 
 from docx.opc.exceptions import PackageNotFoundError
 from docx.opc.packuri import CONTENT_TYPES_URI
+from docx.shared import lazyproperty
+
+# -- buffer size used for a package file opened by path or supplied as an unbuffered
+# -- stream; the 8 KiB io default leads to many small reads and writes when the package
+# -- is large
+_BUFFER_SIZE = 256 * 1024
+
+# -- a member smaller than this is stored rather than deflated; the deflate block and
+# -- its setup cost more than compression can save on so few bytes
+_MIN_DEFLATE_SIZE = 256
+
+# -- extensions of formats that are already compressed, like most embedded media; deflate
+# -- spends CPU on these and gains nothing, so they are stored as-is
+_STORED_EXTS = frozenset(
+    ("docx", "gif", "jpe", "jpeg", "jpg", "mp3", "mp4", "png", "pptx", "wdp", "xlsx", "zip")
+)
 
 
 class PhysPkgReader:
@@ -73,7 +90,19 @@ class _ZipPkgReader(PhysPkgReader):
 
     def __init__(self, pkg_file):
         super(_ZipPkgReader, self).__init__()
-        self._zipf = ZipFile(pkg_file, "r")
+        self._file = None
+        self._buffer = None
+        if isinstance(pkg_file, str):
+            pkg_file = self._file = open(pkg_file, "rb", buffering=_BUFFER_SIZE)  # noqa: SIM115
+        elif isinstance(pkg_file, io.RawIOBase):
+            pkg_file = self._buffer = io.BufferedReader(pkg_file, _BUFFER_SIZE)
+        try:
+            self._zipf = ZipFile(pkg_file, "r")
+        except BaseException:
+            # -- not a readable zip; don't leak the file opened above or let the buffer
+            # -- close the caller's stream when it is garbage-collected --
+            self._release_file()
+            raise
 
     def blob_for(self, pack_uri):
         """Return blob corresponding to `pack_uri`.
@@ -83,8 +112,15 @@ class _ZipPkgReader(PhysPkgReader):
         return self._zipf.read(pack_uri.membername)
 
     def close(self):
-        """Close the zip archive, releasing any resources it is using."""
-        self._zipf.close()
+        """Close the zip archive, releasing any resources it is using.
+
+        A stream supplied by the caller is left open; only a buffer wrapped around it
+        here is discarded.
+        """
+        try:
+            self._zipf.close()
+        finally:
+            self._release_file()
 
     @property
     def content_types_xml(self):
@@ -94,11 +130,28 @@ class _ZipPkgReader(PhysPkgReader):
     def rels_xml_for(self, source_uri):
         """Return rels item XML for source with `source_uri` or None if no rels item is
         present."""
-        try:
-            rels_xml = self.blob_for(source_uri.rels_uri)
-        except KeyError:
-            rels_xml = None
-        return rels_xml
+        rels_uri = source_uri.rels_uri
+        if rels_uri.membername not in self._membernames:
+            return None
+        return self.blob_for(rels_uri)
+
+    @lazyproperty
+    def _membernames(self):
+        """Set of all member names in the zip archive, read once from its central
+        directory.
+
+        Most parts have no rels item, so checking membership here is much cheaper than
+        attempting the read and handling the |KeyError|.
+        """
+        return frozenset(self._zipf.namelist())
+
+    def _release_file(self):
+        """Close the file opened by this reader, if any, or detach the buffer wrapped
+        around a caller's unbuffered stream, leaving that stream open."""
+        if self._file is not None:
+            self._file.close()
+        if self._buffer is not None:
+            self._buffer.detach()
 
 
 class _ZipPkgWriter(PhysPkgWriter):
@@ -106,14 +159,42 @@ class _ZipPkgWriter(PhysPkgWriter):
 
     def __init__(self, pkg_file):
         super(_ZipPkgWriter, self).__init__()
-        self._zipf = ZipFile(pkg_file, "w", compression=ZIP_DEFLATED)
+        self._file = None
+        self._buffer = None
+        if isinstance(pkg_file, str):
+            pkg_file = self._file = open(pkg_file, "wb", buffering=_BUFFER_SIZE)  # noqa: SIM115
+        elif isinstance(pkg_file, io.RawIOBase):
+            pkg_file = self._buffer = io.BufferedWriter(pkg_file, _BUFFER_SIZE)
+        try:
+            self._zipf = ZipFile(pkg_file, "w", compression=ZIP_DEFLATED)
+        except BaseException:
+            self._release_file()
+            raise
 
     def close(self):
         """Close the zip archive, flushing any pending physical writes and releasing any
-        resources it's using."""
-        self._zipf.close()
+        resources it's using.
+
+        A stream supplied by the caller is flushed but left open.
+        """
+        try:
+            self._zipf.close()
+        finally:
+            self._release_file()
 
     def write(self, pack_uri, blob):
         """Write `blob` to this zip package with the membername corresponding to
         `pack_uri`."""
-        self._zipf.writestr(pack_uri.membername, blob)
+        if len(blob) < _MIN_DEFLATE_SIZE or pack_uri.ext.lower() in _STORED_EXTS:
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=ZIP_STORED)
+        else:
+            self._zipf.writestr(pack_uri.membername, blob)
+
+    def _release_file(self):
+        """Close the file opened by this writer, if any, or flush and detach the buffer
+        wrapped around a caller's unbuffered stream, leaving that stream open."""
+        if self._file is not None:
+            self._file.close()
+        if self._buffer is not None:
+            self._buffer.flush()
+            self._buffer.detach()
@@ -1,32 +1,46 @@
 """Low-level, read-only API to a serialized Open Packaging Convention (OPC) package."""
 
+from __future__ import annotations
+
 from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from docx.opc.oxml import parse_xml
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.phys_pkg import PhysPkgReader
-from docx.opc.shared import CaseInsensitiveDict
+from docx.shared import lazyproperty
 
 
 class PackageReader:
     """Provides access to the contents of a zip-format OPC package via its
-    :attr:`serialized_parts` and :attr:`pkg_srels` attributes."""
+    :attr:`serialized_parts` and :attr:`pkg_srels` attributes.
+
+    Part blobs are read from the physical package only when requested, so the reader
+    must be closed with :meth:`close` once the serialized parts have been consumed.
+    """
 
-    def __init__(self, content_types, pkg_srels, sparts):
+    def __init__(self, content_types, pkg_srels, sparts, phys_reader=None):
         super(PackageReader, self).__init__()
         self._pkg_srels = pkg_srels
         self._sparts = sparts
+        self._phys_reader = phys_reader
 
     @staticmethod
     def from_file(pkg_file):
         """Return a |PackageReader| instance loaded with contents of `pkg_file`."""
         phys_reader = PhysPkgReader(pkg_file)
-        content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
-        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
-        sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
-        )
-        phys_reader.close()
-        return PackageReader(content_types, pkg_srels, sparts)
+        try:
+            content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
+            pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+            sparts = PackageReader._load_serialized_parts(phys_reader, pkg_srels, content_types)
+        except BaseException:
+            # -- no reader is returned to close it later, so release the package now --
+            phys_reader.close()
+            raise
+        return PackageReader(content_types, pkg_srels, sparts, phys_reader)
+
+    def close(self):
+        """Close the physical package this reader reads part blobs from."""
+        if self._phys_reader is not None:
+            self._phys_reader.close()
 
     def iter_sparts(self):
         """Generate a 4-tuple `(partname, content_type, reltype, blob)` for each of the
@@ -50,11 +64,11 @@ class PackageReader:
         `pkg_srels`."""
         sparts = []
         part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
-        for partname, blob, reltype, srels in part_walker:
+        for partname, reltype, srels in part_walker:
             content_type = content_types[partname]
-            spart = _SerializedPart(partname, content_type, reltype, blob, srels)
+            spart = _SerializedPart(partname, content_type, reltype, phys_reader, srels)
             sparts.append(spart)
-        return tuple(sparts)
+        return sparts
 
     @staticmethod
     def _srels_for(phys_reader, source_uri):
@@ -64,47 +78,53 @@ class PackageReader:
         return _SerializedRelationships.load_from_xml(source_uri.baseURI, rels_xml)
 
     @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
-        """Generate a 4-tuple `(partname, blob, reltype, srels)` for each of the parts
-        in `phys_reader` by walking the relationship graph rooted at srels."""
-        if visited_partnames is None:
-            visited_partnames = []
-        for srel in srels:
+    def _walk_phys_parts(phys_reader, srels):
+        """Generate a 3-tuple `(partname, reltype, srels)` for each of the parts in
+        `phys_reader` by walking the relationship graph rooted at srels.
+
+        The walk is depth-first and uses an explicit stack of srels iterators rather
+        than a recursive generator per part.
+        """
+        visited_partnames = set()
+        stack = [iter(srels)]
+        while stack:
+            srel = next(stack[-1], None)
+            if srel is None:
+                stack.pop()
+                continue
             if srel.is_external:
                 continue
             partname = srel.target_partname
             if partname in visited_partnames:
                 continue
-            visited_partnames.append(partname)
-            reltype = srel.reltype
+            visited_partnames.add(partname)
             part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
-            yield (partname, blob, reltype, part_srels)
-            next_walker = PackageReader._walk_phys_parts(
-                phys_reader, part_srels, visited_partnames
-            )
-            for partname, blob, reltype, srels in next_walker:
-                yield (partname, blob, reltype, srels)
+            yield (partname, srel.reltype, part_srels)
+            if part_srels:
+                stack.append(iter(part_srels))
 
 
 class _ContentTypeMap:
     """Value type providing dictionary semantics for looking up content type by part
-    name, e.g. ``content_type = cti['/ppt/presentation.xml']``."""
+    name, e.g. ``content_type = cti['/ppt/presentation.xml']``.
+
+    Both partnames and extensions match without respect to case. Keys are lowercased as
+    they are added so lookups are plain dict operations.
+    """
 
     def __init__(self):
         super(_ContentTypeMap, self).__init__()
-        self._overrides = CaseInsensitiveDict()
-        self._defaults = CaseInsensitiveDict()
+        self._overrides: dict[str, str] = {}
+        self._defaults: dict[str, str] = {}
 
     def __getitem__(self, partname):
-        """Return content type for part identified by `partname`."""
-        if not isinstance(partname, PackURI):
-            tmpl = "_ContentTypeMap key must be <type 'PackURI'>, got %s"
-            raise KeyError(tmpl % type(partname))
-        if partname in self._overrides:
-            return self._overrides[partname]
-        if partname.ext in self._defaults:
-            return self._defaults[partname.ext]
+        """Return content type for part identified by `partname`, a |PackURI|."""
+        content_type = self._overrides.get(partname.lower())
+        if content_type is not None:
+            return content_type
+        content_type = self._defaults.get(partname.ext.lower())
+        if content_type is not None:
+            return content_type
         tmpl = "no content type for partname '%s' in [Content_Types].xml"
         raise KeyError(tmpl % partname)
 
@@ -123,27 +143,28 @@ class _ContentTypeMap:
     def _add_default(self, extension, content_type):
         """Add the default mapping of `extension` to `content_type` to this content type
         mapping."""
-        self._defaults[extension] = content_type
+        self._defaults[extension.lower()] = content_type
 
     def _add_override(self, partname, content_type):
         """Add the default mapping of `partname` to `content_type` to this content type
         mapping."""
-        self._overrides[partname] = content_type
+        self._overrides[partname.lower()] = content_type
 
 
 class _SerializedPart:
     """Value object for an OPC package part.
 
     Provides access to the partname, content type, blob, and serialized relationships
-    for the part.
+    for the part. The blob is read from `phys_reader` each time it is accessed rather
+    than held, so only the parts currently being loaded occupy memory.
     """
 
-    def __init__(self, partname, content_type, reltype, blob, srels):
+    def __init__(self, partname, content_type, reltype, phys_reader, srels):
         super(_SerializedPart, self).__init__()
         self._partname = partname
         self._content_type = content_type
         self._reltype = reltype
-        self._blob = blob
+        self._phys_reader = phys_reader
         self._srels = srels
 
     @property
@@ -156,7 +177,7 @@ class _SerializedPart:
 
     @property
     def blob(self):
-        return self._blob
+        return self._phys_reader.blob_for(self._partname)
 
     @property
     def reltype(self):
@@ -212,7 +233,7 @@ class _SerializedRelationship:
         for external target mode."""
         return self._target_ref
 
-    @property
+    @lazyproperty
     def target_partname(self):
         """|PackURI| instance containing partname targeted by this relationship.
 
@@ -225,34 +246,31 @@ class _SerializedRelationship:
                 'here TargetMode == "External"'
             )
             raise ValueError(msg)
-        # lazy-load _target_partname attribute
-        if not hasattr(self, "_target_partname"):
-            self._target_partname = PackURI.from_rel_ref(self._baseURI, self.target_ref)
-        return self._target_partname
+        return PackURI.from_rel_ref(self._baseURI, self.target_ref)
 
 
-class _SerializedRelationships:
+class _SerializedRelationships(tuple):
     """Read-only sequence of |_SerializedRelationship| instances corresponding to the
-    relationships item XML passed to constructor."""
-
-    def __init__(self):
-        super(_SerializedRelationships, self).__init__()
-        self._srels = []
+    relationships item XML passed to constructor.
 
-    def __iter__(self):
-        """Support iteration, e.g. 'for x in srels:'."""
-        return self._srels.__iter__()
+    A tuple subclass, so iteration, `len()` and indexing run at C speed.
+    """
 
     @staticmethod
     def load_from_xml(baseURI, rels_item_xml):
         """Return |_SerializedRelationships| instance loaded with the relationships
         contained in `rels_item_xml`.
 
-        Returns an empty collection if `rels_item_xml` is |None|.
+        Returns the shared empty collection if `rels_item_xml` is |None|, as it is for
+        most parts.
         """
-        srels = _SerializedRelationships()
-        if rels_item_xml is not None:
-            rels_elm = parse_xml(rels_item_xml)
-            for rel_elm in rels_elm.Relationship_lst:
-                srels._srels.append(_SerializedRelationship(baseURI, rel_elm))
-        return srels
+        if rels_item_xml is None:
+            return _EMPTY_SRELS
+        rels_elm = parse_xml(rels_item_xml)
+        return _SerializedRelationships(
+            _SerializedRelationship(baseURI, rel_elm) for rel_elm in rels_elm.Relationship_lst
+        )
+
+
+# -- immutable, so a single instance serves every part that has no rels item --
+_EMPTY_SRELS = _SerializedRelationships()
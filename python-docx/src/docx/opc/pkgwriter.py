@@ -12,7 +12,6 @@ from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.oxml import CT_Types, serialize_part_xml
 from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
 from docx.opc.phys_pkg import PhysPkgWriter
-from docx.opc.shared import CaseInsensitiveDict
 from docx.opc.spec import default_content_types
 
 if TYPE_CHECKING:
@@ -32,10 +31,14 @@ class PackageWriter:
         """Write a physical package (.pptx file) to `pkg_file` containing `pkg_rels` and
         `parts` and a content types stream based on the content types of the parts."""
         phys_writer = PhysPkgWriter(pkg_file)
-        PackageWriter._write_content_types_stream(phys_writer, parts)
-        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
-        phys_writer.close()
+        try:
+            PackageWriter._write_content_types_stream(phys_writer, parts)
+            PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
+            PackageWriter._write_parts(phys_writer, parts)
+        finally:
+            # -- always runs, so a failed save never leaves the package file open or the
+            # -- caller's stream at the mercy of a garbage-collected buffer --
+            phys_writer.close()
 
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
@@ -68,7 +71,8 @@ class _ContentTypesItem:
     """
 
     def __init__(self):
-        self._defaults = CaseInsensitiveDict()
+        # -- keyed by lowercase extension; callers normalize on insert --
+        self._defaults: dict[str, str] = {}
         self._overrides = {}
 
     @property
@@ -92,8 +96,8 @@ class _ContentTypesItem:
     def _add_content_type(self, partname, content_type):
         """Add a content type for the part with `partname` and `content_type`, using a
         default or override as appropriate."""
-        ext = partname.ext
-        if (ext.lower(), content_type) in default_content_types:
+        ext = partname.ext.lower()
+        if (ext, content_type) in default_content_types:
             self._defaults[ext] = content_type
         else:
             self._overrides[partname] = content_type
@@ -17,6 +17,24 @@ class Relationships(Dict[str, "_Relationship"]):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId: dict[str, Any] = {}
+        # -- first relationship in collection for each (reltype, target, is_external) --
+        self._rels_by_match_key: dict[tuple[str, Any, bool], _Relationship] = {}
+        # -- every rId below 'rId{n}' for this n is known to be in use --
+        self._rId_floor = 1
+
+    def __setitem__(self, rId: str, rel: _Relationship):
+        if rId in self:
+            self._unindex(self[rId])
+        super(Relationships, self).__setitem__(rId, rel)
+        self._rels_by_match_key.setdefault(_match_key(rel), rel)
+
+    def __delitem__(self, rId: str):
+        rel = self[rId]
+        super(Relationships, self).__delitem__(rId)
+        self._unindex(rel)
+        if isinstance(rId, str) and rId.startswith("rId") and rId[3:].isdigit():
+            # -- numbering starts at "rId1", so an out-of-range "rId0" never lowers it --
+            self._rId_floor = max(1, min(self._rId_floor, int(rId[3:])))
 
     def add_relationship(
         self, reltype: str, target: Part | str, rId: str, is_external: bool = False
@@ -72,21 +90,7 @@ class Relationships(Dict[str, "_Relationship"]):
     ) -> _Relationship | None:
         """Return relationship of matching `reltype`, `target`, and `is_external` from
         collection, or None if not found."""
-
-        def matches(rel: _Relationship, reltype: str, target: Part | str, is_external: bool):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        return self._rels_by_match_key.get((reltype, target, is_external))
 
     def _get_rel_of_type(self, reltype: str):
         """Return single relationship of type `reltype` from the collection.
@@ -103,14 +107,46 @@ class Relationships(Dict[str, "_Relationship"]):
             raise ValueError(tmpl % reltype)
         return matching[0]
 
+    def _unindex(self, rel: _Relationship):
+        """Remove `rel`, no longer in this collection, from the match-key index.
+
+        When another relationship has the same match key, the first such one becomes the
+        indexed one, preserving first-match semantics.
+        """
+        key = _match_key(rel)
+        if self._rels_by_match_key.get(key) is not rel:
+            return
+        del self._rels_by_match_key[key]
+        for other in self.values():
+            if other is not rel and _match_key(other) == key:
+                self._rels_by_match_key[key] = other
+                break
+
     @property
-    def _next_rId(self) -> str:  # pyright: ignore[reportReturnType]
+    def _next_rId(self) -> str:
         """Next available rId in collection, starting from 'rId1' and making use of any
-        gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3']."""
-        for n in range(1, len(self) + 2):
-            rId_candidate = "rId%d" % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
+
+        Probing resumes from the lowest rId not yet known to be in use, which only moves
+        back when a relationship is deleted, so adding N relationships is O(N) overall
+        rather than O(N²).
+        """
+        n = self._rId_floor
+        while "rId%d" % n in self:
+            n += 1
+        self._rId_floor = n
+        return "rId%d" % n
+
+
+def _match_key(rel: _Relationship) -> tuple[str, Any, bool]:
+    """The `(reltype, target, is_external)` key `rel` is matched on.
+
+    The target is the target part itself, hashed by identity, for an internal
+    relationship and the target URI for an external one.
+    """
+    is_external = rel.is_external
+    target = rel.target_ref if is_external else rel.target_part
+    return (rel.reltype, target, is_external)
 
 
 class _Relationship:
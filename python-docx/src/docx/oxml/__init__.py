@@ -84,9 +84,12 @@ register_element_cls("w:titlePg", CT_OnOff)
 # ---------------------------------------------------------------------------
 # other custom element class mappings
 
-from .coreprops import CT_CoreProperties  # noqa
+from .coreprops import CT_CoreProperties, CT_DatetimeProperty, CT_W3CDTFProperty  # noqa
 
 register_element_cls("cp:coreProperties", CT_CoreProperties)
+register_element_cls("cp:lastPrinted", CT_DatetimeProperty)
+register_element_cls("dcterms:created", CT_W3CDTFProperty)
+register_element_cls("dcterms:modified", CT_W3CDTFProperty)
 
 from .document import CT_Body, CT_Document  # noqa
 
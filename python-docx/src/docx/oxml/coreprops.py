@@ -3,16 +3,27 @@
 from __future__ import annotations
 
 import datetime as dt
-import re
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, cast
 
-from docx.oxml.ns import nsdecls, qn
+from docx.oxml.ns import nsdecls, nsmap, qn
 from docx.oxml.parser import parse_xml
 from docx.oxml.xmlchemy import BaseOxmlElement, ZeroOrOne
 
 if TYPE_CHECKING:
     from lxml.etree import _Element as etree_Element  # pyright: ignore[reportPrivateUsage]
 
+# -- number of fixed-width fields in the date/time part of a W3CDTF string, by length --
+_W3CDTF_FIELD_COUNTS = {4: 1, 7: 2, 10: 3, 19: 6}
+# -- `strptime()` templates tried when the date/time part is not in fixed-width form --
+_W3CDTF_TEMPLATES = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m", "%Y")
+
+# -- Clark names of the `xsi:` attributes set when writing `created` and `modified` --
+_XSI_TYPE = qn("xsi:type")
+_XSI_FOO = qn("xsi:foo")
+
+# -- unbound "get_or_add_x()" methods of CT_CoreProperties, by property name --
+_get_or_add_methods: dict[str, Callable[[CT_CoreProperties], BaseOxmlElement]] = {}
+
 
 class CT_CoreProperties(BaseOxmlElement):
     """`<cp:coreProperties>` element, the root element of the Core Properties part.
@@ -42,7 +53,7 @@ class CT_CoreProperties(BaseOxmlElement):
     title = ZeroOrOne("dc:title", successors=())
     version = ZeroOrOne("cp:version", successors=())
 
-    _coreProperties_tmpl = "<cp:coreProperties %s/>\n" % nsdecls("cp", "dc", "dcterms")
+    _coreProperties_tmpl = "<cp:coreProperties %s/>\n" % nsdecls("cp", "dc", "dcterms", "xsi")
 
     @classmethod
     def new(cls):
@@ -54,7 +65,7 @@ class CT_CoreProperties(BaseOxmlElement):
     @property
     def author_text(self):
         """The text in the `dc:creator` child element."""
-        return self._text_of_element("creator")
+        return self._text_of_element(self.creator)
 
     @author_text.setter
     def author_text(self, value: str):
@@ -62,7 +73,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def category_text(self) -> str:
-        return self._text_of_element("category")
+        return self._text_of_element(self.category)
 
     @category_text.setter
     def category_text(self, value: str):
@@ -70,7 +81,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def comments_text(self) -> str:
-        return self._text_of_element("description")
+        return self._text_of_element(self.description)
 
     @comments_text.setter
     def comments_text(self, value: str):
@@ -78,7 +89,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def contentStatus_text(self):
-        return self._text_of_element("contentStatus")
+        return self._text_of_element(self.contentStatus)
 
     @contentStatus_text.setter
     def contentStatus_text(self, value: str):
@@ -86,7 +97,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def created_datetime(self):
-        return self._datetime_of_element("created")
+        return self._datetime_of_element(self.created)
 
     @created_datetime.setter
     def created_datetime(self, value: dt.datetime):
@@ -94,7 +105,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def identifier_text(self):
-        return self._text_of_element("identifier")
+        return self._text_of_element(self.identifier)
 
     @identifier_text.setter
     def identifier_text(self, value: str):
@@ -102,7 +113,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def keywords_text(self):
-        return self._text_of_element("keywords")
+        return self._text_of_element(self.keywords)
 
     @keywords_text.setter
     def keywords_text(self, value: str):
@@ -110,7 +121,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def language_text(self):
-        return self._text_of_element("language")
+        return self._text_of_element(self.language)
 
     @language_text.setter
     def language_text(self, value: str):
@@ -118,7 +129,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def lastModifiedBy_text(self):
-        return self._text_of_element("lastModifiedBy")
+        return self._text_of_element(self.lastModifiedBy)
 
     @lastModifiedBy_text.setter
     def lastModifiedBy_text(self, value: str):
@@ -126,7 +137,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def lastPrinted_datetime(self):
-        return self._datetime_of_element("lastPrinted")
+        return self._datetime_of_element(self.lastPrinted)
 
     @lastPrinted_datetime.setter
     def lastPrinted_datetime(self, value: dt.datetime):
@@ -134,7 +145,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def modified_datetime(self) -> dt.datetime | None:
-        return self._datetime_of_element("modified")
+        return self._datetime_of_element(self.modified)
 
     @modified_datetime.setter
     def modified_datetime(self, value: dt.datetime):
@@ -168,7 +179,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def subject_text(self):
-        return self._text_of_element("subject")
+        return self._text_of_element(self.subject)
 
     @subject_text.setter
     def subject_text(self, value: str):
@@ -176,7 +187,7 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def title_text(self):
-        return self._text_of_element("title")
+        return self._text_of_element(self.title)
 
     @title_text.setter
     def title_text(self, value: str):
@@ -184,14 +195,17 @@ class CT_CoreProperties(BaseOxmlElement):
 
     @property
     def version_text(self):
-        return self._text_of_element("version")
+        return self._text_of_element(self.version)
 
     @version_text.setter
     def version_text(self, value: str):
         self._set_element_text("version", value)
 
-    def _datetime_of_element(self, property_name: str) -> dt.datetime | None:
-        element = getattr(self, property_name)
+    def _datetime_of_element(self, element: BaseOxmlElement | None) -> dt.datetime | None:
+        """The |datetime| parsed from the text of `element`.
+
+        |None| if `element` is not present or its text is not a valid W3CDTF string.
+        """
         if element is None:
             return None
         datetime_str = element.text
@@ -203,10 +217,11 @@ class CT_CoreProperties(BaseOxmlElement):
 
     def _get_or_add(self, prop_name: str) -> BaseOxmlElement:
         """Return element returned by "get_or_add_" method for `prop_name`."""
-        get_or_add_method_name = "get_or_add_%s" % prop_name
-        get_or_add_method = getattr(self, get_or_add_method_name)
-        element = get_or_add_method()
-        return element
+        get_or_add = _get_or_add_methods.get(prop_name)
+        if get_or_add is None:
+            get_or_add = getattr(CT_CoreProperties, "get_or_add_%s" % prop_name)
+            _get_or_add_methods[prop_name] = get_or_add
+        return get_or_add(self)
 
     @classmethod
     def _offset_dt(cls, dt_: dt.datetime, offset_str: str) -> dt.datetime:
@@ -214,18 +229,21 @@ class CT_CoreProperties(BaseOxmlElement):
 
         `offset_str` is like `"-07:00"`.
         """
-        match = cls._offset_pattern.match(offset_str)
-        if match is None:
+        # -- fixed layout "±HH:MM", so check its characters directly rather than by regex --
+        if (
+            len(offset_str) < 6
+            or offset_str[0] not in "+-"
+            or offset_str[3] != ":"
+            or not (offset_str[1:3] + offset_str[4:6]).isdecimal()
+        ):
             raise ValueError("'%s' is not a valid offset string" % offset_str)
-        sign, hours_str, minutes_str = match.groups()
+        sign, hours_str, minutes_str = offset_str[0], offset_str[1:3], offset_str[4:6]
         sign_factor = -1 if sign == "+" else 1
         hours = int(hours_str) * sign_factor
         minutes = int(minutes_str) * sign_factor
         td = dt.timedelta(hours=hours, minutes=minutes)
         return dt_ + td
 
-    _offset_pattern = re.compile(r"([+-])(\d\d):(\d\d)")
-
     @classmethod
     def _parse_W3CDTF_to_datetime(cls, w3cdtf_str: str) -> dt.datetime:
         # valid W3CDTF date cases:
@@ -234,22 +252,19 @@ class CT_CoreProperties(BaseOxmlElement):
         # yyyy-mm-dd e.g. "2003-12-31"
         # UTC timezone e.g. "2003-12-31T10:14:55Z"
         # numeric timezone e.g. "2003-12-31T10:14:55-08:00"
-        templates = (
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d",
-            "%Y-%m",
-            "%Y",
-        )
-        # strptime isn't smart enough to parse literal timezone offsets like
-        # "-07:30", so we have to do it ourselves
+        # -- strptime isn't smart enough to parse literal timezone offsets like "-07:30",
+        # -- so we have to do it ourselves
         parseable_part = w3cdtf_str[:19]
         offset_str = w3cdtf_str[19:]
-        dt_ = None
-        for tmpl in templates:
-            try:
-                dt_ = dt.datetime.strptime(parseable_part, tmpl)
-            except ValueError:
-                continue
+        dt_ = cls._parse_fixed_width_W3CDTF(parseable_part)
+        if dt_ is None:
+            # -- fields that are not zero-padded, e.g. "2003-1-5", are still accepted --
+            for tmpl in _W3CDTF_TEMPLATES:
+                try:
+                    dt_ = dt.datetime.strptime(parseable_part, tmpl)
+                except ValueError:
+                    continue
+                break
         if dt_ is None:
             tmpl = "could not parse W3CDTF datetime string '%s'"
             raise ValueError(tmpl % w3cdtf_str)
@@ -257,22 +272,40 @@ class CT_CoreProperties(BaseOxmlElement):
             dt_ = cls._offset_dt(dt_, offset_str)
         return dt_.replace(tzinfo=dt.timezone.utc)
 
+    @staticmethod
+    def _parse_fixed_width_W3CDTF(parseable_part: str) -> dt.datetime | None:
+        """Naive datetime parsed from the date/time part of a W3CDTF string.
+
+        |None| if `parseable_part` is not one of the fixed-width forms or its fields are
+        out of range. Slicing the fields apart is much faster than `strptime()`.
+        """
+        field_count = _W3CDTF_FIELD_COUNTS.get(len(parseable_part))
+        # -- field separators are at every third character, starting at index 4 --
+        if field_count is None or parseable_part[4::3] != "--T::"[: field_count - 1]:
+            return None
+        fields = [parseable_part[:4]] + [
+            parseable_part[i : i + 2] for i in range(5, 3 * field_count + 2, 3)
+        ]
+        if not all(field.isdecimal() for field in fields):
+            return None
+        values = [int(field) for field in fields] + [1] * (3 - field_count)
+        try:
+            return dt.datetime(*values)
+        except ValueError:
+            return None
+
     def _set_element_datetime(self, prop_name: str, value: dt.datetime):
         """Set date/time value of child element having `prop_name` to `value`."""
         if not isinstance(value, dt.datetime):  # pyright: ignore[reportUnnecessaryIsInstance]
             tmpl = "property requires <type 'datetime.datetime'> object, got %s"
             raise ValueError(tmpl % type(value))
-        element = self._get_or_add(prop_name)
-        dt_str = value.strftime("%Y-%m-%dT%H:%M:%SZ")
-        element.text = dt_str
-        if prop_name in ("created", "modified"):
-            # These two require an explicit "xsi:type="dcterms:W3CDTF""
-            # attribute. The first and last line are a hack required to add
-            # the xsi namespace to the root element rather than each child
-            # element in which it is referenced
-            self.set(qn("xsi:foo"), "bar")
-            element.set(qn("xsi:type"), "dcterms:W3CDTF")
-            del self.attrib[qn("xsi:foo")]
+        element = cast(CT_DatetimeProperty, self._get_or_add(prop_name))
+        # -- formatted field by field; `strftime()` is slower and does not zero-pad years
+        # -- before 1000 on all platforms.
+        element.set_datetime_text(
+            f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+            f"T{value.hour:02d}:{value.minute:02d}:{value.second:02d}Z"
+        )
 
     def _set_element_text(self, prop_name: str, value: Any) -> None:
         """Set string value of `name` property to `value`."""
@@ -285,14 +318,43 @@ class CT_CoreProperties(BaseOxmlElement):
         element = self._get_or_add(prop_name)
         element.text = value
 
-    def _text_of_element(self, property_name: str) -> str:
-        """The text in the element matching `property_name`.
+    def _text_of_element(self, element: BaseOxmlElement | None) -> str:
+        """The text in `element`.
 
         The empty string if the element is not present or contains no text.
         """
-        element = getattr(self, property_name)
         if element is None:
             return ""
-        if element.text is None:
-            return ""
-        return element.text
+        return element.text or ""
+
+
+class CT_DatetimeProperty(BaseOxmlElement):
+    """`<cp:lastPrinted>` element, a core property having a date/time value."""
+
+    def set_datetime_text(self, datetime_str: str) -> None:
+        """Set the text of this element to the W3CDTF string `datetime_str`."""
+        self.text = datetime_str
+
+
+class CT_W3CDTFProperty(CT_DatetimeProperty):
+    """`<dcterms:created>` or `<dcterms:modified>` element.
+
+    Unlike other date/time core properties, these two require an explicit
+    `xsi:type="dcterms:W3CDTF"` attribute.
+    """
+
+    def set_datetime_text(self, datetime_str: str) -> None:
+        """Set the text of this element and mark it as a `dcterms:W3CDTF` value."""
+        self.text = datetime_str
+        # -- When the `cp:coreProperties` root doesn't already declare the xsi namespace,
+        # -- a dummy attribute is set and removed on it, a hack required to add the
+        # -- namespace declaration to the root element rather than to each child element
+        # -- in which it is referenced. New core properties, and those written by Word,
+        # -- have it.
+        root = self.getparent()
+        if root is None or nsmap["xsi"] in root.nsmap.values():
+            self.set(_XSI_TYPE, "dcterms:W3CDTF")
+            return
+        root.set(_XSI_FOO, "bar")
+        self.set(_XSI_TYPE, "dcterms:W3CDTF")
+        del root.attrib[_XSI_FOO]
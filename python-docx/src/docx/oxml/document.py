@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Callable, List
 
+from lxml import etree
+
+from docx.oxml.ns import nsmap, qn
 from docx.oxml.section import CT_SectPr
 from docx.oxml.xmlchemy import BaseOxmlElement, ZeroOrMore, ZeroOrOne
 
@@ -11,6 +14,9 @@ if TYPE_CHECKING:
     from docx.oxml.table import CT_Tbl
     from docx.oxml.text.paragraph import CT_P
 
+_SECTPR_LST_XPATH = etree.XPath("./w:body/w:p/w:pPr/w:sectPr | ./w:body/w:sectPr", namespaces=nsmap)
+_INNER_CONTENT_XPATH = etree.XPath("./w:p | ./w:tbl", namespaces=nsmap)
+
 
 class CT_Document(BaseOxmlElement):
     """``<w:document>`` element, the root element of a document.xml file."""
@@ -28,8 +34,7 @@ class CT_Document(BaseOxmlElement):
         `w:sectPr` elements appear in document order. The last one is always
         `w:body/w:sectPr`, all preceding are `w:p/w:pPr/w:sectPr`.
         """
-        xpath = "./w:body/w:p/w:pPr/w:sectPr | ./w:body/w:sectPr"
-        return self.xpath(xpath)
+        return _SECTPR_LST_XPATH(self)
 
 
 class CT_Body(BaseOxmlElement):
@@ -65,8 +70,7 @@ class CT_Body(BaseOxmlElement):
         # ---add exact copy to new `w:p` element; that is now second-to last section---
         self.add_p().set_sectPr(sentinel_sectPr.clone())
         # ---remove any header or footer references from "new" last section---
-        for hdrftr_ref in sentinel_sectPr.xpath("w:headerReference|w:footerReference"):
-            sentinel_sectPr.remove(hdrftr_ref)
+        etree.strip_elements(sentinel_sectPr, qn("w:headerReference"), qn("w:footerReference"))
         # ---the sentinel `w:sectPr` now controls the new last section---
         return sentinel_sectPr
 
@@ -75,8 +79,11 @@ class CT_Body(BaseOxmlElement):
 
         Leave the <w:sectPr> element if it is present.
         """
-        for content_elm in self.xpath("./*[not(self::w:sectPr)]"):
-            self.remove(content_elm)
+        sectPr_tag = qn("w:sectPr")
+        # -- `etree.Element` restricts this to element children, like `./*` would --
+        for content_elm in list(self.iterchildren(etree.Element)):
+            if content_elm.tag != sectPr_tag:
+                self.remove(content_elm)
 
     @property
     def inner_content_elements(self) -> List[CT_P | CT_Tbl]:
@@ -85,4 +92,4 @@ class CT_Body(BaseOxmlElement):
         Elements appear in document order. Elements shaded by nesting in a `w:ins` or
         other "wrapper" element will not be included.
         """
-        return self.xpath("./w:p | ./w:tbl")
+        return _INNER_CONTENT_XPATH(self)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import functools
+from typing import Any, Dict, Tuple
 
 nsmap = {
     "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
@@ -25,6 +26,9 @@ nsmap = {
 
 pfxmap = {value: key for key, value in nsmap.items()}
 
+# -- (prefix, local-part, namespace-uri) of each namespace-prefixed tag seen so far --
+_nstag_parts: Dict[str, Tuple[str, str, str]] = {}
+
 
 class NamespacePrefixedTag(str):
     """Value object that knows the semantics of an XML tag having a namespace prefix."""
@@ -33,17 +37,21 @@ class NamespacePrefixedTag(str):
         return super(NamespacePrefixedTag, cls).__new__(cls, nstag)
 
     def __init__(self, nstag: str):
-        self._pfx, self._local_part = nstag.split(":")
-        self._ns_uri = nsmap[self._pfx]
+        # -- the set of tags in use is small, so each one is only split the first time --
+        parts = _nstag_parts.get(nstag)
+        if parts is None:
+            pfx, local_part = nstag.split(":")
+            parts = _nstag_parts[nstag] = (pfx, local_part, nsmap[pfx])
+        self._pfx, self._local_part, self._ns_uri = parts
 
     @property
     def clark_name(self) -> str:
-        return "{%s}%s" % (self._ns_uri, self._local_part)
+        return qn(self)
 
     @classmethod
     def from_clark_name(cls, clark_name: str) -> NamespacePrefixedTag:
         nsuri, local_name = clark_name[1:].split("}")
-        nstag = "%s:%s" % (pfxmap[nsuri], local_name)
+        nstag = f"{pfxmap[nsuri]}:{local_name}"
         return cls(nstag)
 
     @property
@@ -86,7 +94,7 @@ def nsdecls(*prefixes: str) -> str:
 
     Handy for adding required namespace declarations to a tree root element.
     """
-    return " ".join(['xmlns:%s="%s"' % (pfx, nsmap[pfx]) for pfx in prefixes])
+    return " ".join([f'xmlns:{pfx}="{nsmap[pfx]}"' for pfx in prefixes])
 
 
 def nspfxmap(*nspfxs: str) -> Dict[str, str]:
@@ -97,13 +105,19 @@ def nspfxmap(*nspfxs: str) -> Dict[str, str]:
     return {pfx: nsmap[pfx] for pfx in nspfxs}
 
 
+@functools.lru_cache(maxsize=None)
 def qn(tag: str) -> str:
     """Stands for "qualified name".
 
     This utility function converts a familiar namespace-prefixed tag name like "w:p"
     into a Clark-notation qualified tag name for lxml. For example, `qn("w:p")` returns
     "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p".
+
+    The set of tags used is small and fixed, so results are cached without bound; a
+    repeated call is a single dict lookup.
     """
-    prefix, tagroot = tag.split(":")
-    uri = nsmap[prefix]
-    return "{%s}%s" % (uri, tagroot)
+    # -- partition on the colon rather than `.split()` to avoid allocating a list --
+    prefix, sep, tagroot = tag.partition(":")
+    if not sep or ":" in tagroot:
+        raise ValueError(f"expected a namespace-prefixed tag like 'w:p', got '{tag}'")
+    return f"{{{nsmap[prefix]}}}{tagroot}"
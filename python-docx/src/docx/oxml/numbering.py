@@ -1,5 +1,8 @@
 """Custom element classes related to the numbering part."""
 
+from lxml import etree
+
+from docx.oxml.ns import nsmap
 from docx.oxml.parser import OxmlElement
 from docx.oxml.shared import CT_DecimalNumber
 from docx.oxml.simpletypes import ST_DecimalNumber
@@ -11,6 +14,8 @@ from docx.oxml.xmlchemy import (
     ZeroOrOne,
 )
 
+_NUM_HAVING_NUMID_XPATH = etree.XPath("./w:num[@w:numId=$numId]", namespaces=nsmap)
+
 
 class CT_Num(BaseOxmlElement):
     """``<w:num>`` element, which represents a concrete list definition instance, having
@@ -91,9 +96,8 @@ class CT_Numbering(BaseOxmlElement):
     def num_having_numId(self, numId):
         """Return the ``<w:num>`` child element having ``numId`` attribute matching
         `numId`."""
-        xpath = './w:num[@w:numId="%d"]' % numId
         try:
-            return self.xpath(xpath)[0]
+            return _NUM_HAVING_NUMID_XPATH(self, numId="%d" % numId)[0]
         except IndexError:
             raise KeyError("no <w:num> element with numId %d" % numId)
 
@@ -102,8 +106,8 @@ class CT_Numbering(BaseOxmlElement):
         """The first ``numId`` unused by a ``<w:num>`` element, starting at 1 and
         filling any gaps in numbering between existing ``<w:num>`` elements."""
         numId_strs = self.xpath("./w:num/@w:numId")
-        num_ids = [int(numId_str) for numId_str in numId_strs]
-        for num in range(1, len(num_ids) + 2):
-            if num not in num_ids:
-                break
+        num_ids = {int(numId_str) for numId_str in numId_strs}
+        num = 1
+        while num in num_ids:
+            num += 1
         return num
@@ -19,6 +19,13 @@ element_class_lookup = etree.ElementNamespaceClassLookup()
 oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 oxml_parser.set_element_class_lookup(element_class_lookup)
 
+# -- libxml2 rejects a text node longer than 10,000,000 bytes unless `huge_tree` is set,
+# -- so XML that may be larger than that is parsed with limits lifted. XML known to be
+# -- smaller keeps the default protections.
+_HUGE_XML_SIZE = 10000000
+_huge_oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False, huge_tree=True)
+_huge_oxml_parser.set_element_class_lookup(element_class_lookup)
+
 
 def parse_xml(xml: str | bytes) -> "BaseOxmlElement":
     """Root lxml element obtained by parsing XML character string `xml`.
@@ -26,7 +33,10 @@ def parse_xml(xml: str | bytes) -> "BaseOxmlElement":
     The custom parser is used, so custom element classes are produced for elements in
     `xml` that have them.
     """
-    return cast("BaseOxmlElement", etree.fromstring(xml, oxml_parser))
+    # -- a str is measured by its worst-case UTF-8 size of four bytes per character --
+    xml_size = len(xml) * 4 if isinstance(xml, str) else len(xml)
+    parser = oxml_parser if xml_size < _HUGE_XML_SIZE else _huge_oxml_parser
+    return cast("BaseOxmlElement", etree.fromstring(xml, parser))
 
 
 def register_element_cls(tag: str, cls: Type["BaseOxmlElement"]):
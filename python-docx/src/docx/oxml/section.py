@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import Callable, Iterator, List, Sequence, cast
+from typing import Callable, Iterator, List, cast
 
 from lxml import etree
 from typing_extensions import TypeAlias
 
 from docx.enum.section import WD_HEADER_FOOTER, WD_ORIENTATION, WD_SECTION_START
-from docx.oxml.ns import nsmap
+from docx.oxml.ns import nsmap, qn
 from docx.oxml.shared import CT_OnOff
 from docx.oxml.simpletypes import ST_SignedTwipsMeasure, ST_TwipsMeasure, XsdString
 from docx.oxml.table import CT_Tbl
@@ -21,10 +21,21 @@ from docx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
 )
-from docx.shared import Length, lazyproperty
+from docx.shared import Length
 
 BlockElement: TypeAlias = "CT_P | CT_Tbl"
 
+_INNER_CONTENT_XPATH = etree.XPath("./w:p | ./w:tbl", namespaces=nsmap)
+_FOOTER_REFERENCE_XPATH = etree.XPath("./w:footerReference[@w:type=$type]", namespaces=nsmap)
+_HEADER_REFERENCE_XPATH = etree.XPath("./w:headerReference[@w:type=$type]", namespaces=nsmap)
+
+# -- Clark names of the tags compared directly when walking the tree --
+_W_BODY = qn("w:body")
+_W_P = qn("w:p")
+_W_PPR = qn("w:pPr")
+_W_SECTPR = qn("w:sectPr")
+_W_TBL = qn("w:tbl")
+
 
 class CT_HdrFtr(BaseOxmlElement):
     """`w:hdr` and `w:ftr`, the root element for header and footer part respectively."""
@@ -45,7 +56,7 @@ class CT_HdrFtr(BaseOxmlElement):
         Elements appear in document order. Elements shaded by nesting in a `w:ins` or
         other "wrapper" element will not be included.
         """
-        return self.xpath("./w:p | ./w:tbl")
+        return _INNER_CONTENT_XPATH(self)
 
 
 class CT_HdrFtrRef(BaseOxmlElement):
@@ -181,7 +192,7 @@ class CT_SectPr(BaseOxmlElement):
     @bottom_margin.setter
     def bottom_margin(self, value: int | Length | None):
         pgMar = self.get_or_add_pgMar()
-        pgMar.bottom = value if value is None or isinstance(value, Length) else Length(value)
+        pgMar.bottom = _coerce_length(value)
 
     def clone(self) -> CT_SectPr:
         """Return an exact duplicate of this ``<w:sectPr>`` element tree suitable for
@@ -209,20 +220,19 @@ class CT_SectPr(BaseOxmlElement):
     @footer.setter
     def footer(self, value: int | Length | None):
         pgMar = self.get_or_add_pgMar()
-        pgMar.footer = value if value is None or isinstance(value, Length) else Length(value)
+        pgMar.footer = _coerce_length(value)
 
     def get_footerReference(self, type_: WD_HEADER_FOOTER) -> CT_HdrFtrRef | None:
         """Return footerReference element of `type_` or None if not present."""
-        path = "./w:footerReference[@w:type='%s']" % WD_HEADER_FOOTER.to_xml(type_)
-        footerReferences = self.xpath(path)
+        footerReferences = _FOOTER_REFERENCE_XPATH(self, type=WD_HEADER_FOOTER.to_xml(type_))
         if not footerReferences:
             return None
         return footerReferences[0]
 
     def get_headerReference(self, type_: WD_HEADER_FOOTER) -> CT_HdrFtrRef | None:
         """Return headerReference element of `type_` or None if not present."""
-        matching_headerReferences = self.xpath(
-            "./w:headerReference[@w:type='%s']" % WD_HEADER_FOOTER.to_xml(type_)
+        matching_headerReferences = _HEADER_REFERENCE_XPATH(
+            self, type=WD_HEADER_FOOTER.to_xml(type_)
         )
         if len(matching_headerReferences) == 0:
             return None
@@ -241,7 +251,7 @@ class CT_SectPr(BaseOxmlElement):
     @gutter.setter
     def gutter(self, value: int | Length | None):
         pgMar = self.get_or_add_pgMar()
-        pgMar.gutter = value if value is None or isinstance(value, Length) else Length(value)
+        pgMar.gutter = _coerce_length(value)
 
     @property
     def header(self) -> Length | None:
@@ -258,7 +268,7 @@ class CT_SectPr(BaseOxmlElement):
     @header.setter
     def header(self, value: int | Length | None):
         pgMar = self.get_or_add_pgMar()
-        pgMar.header = value if value is None or isinstance(value, Length) else Length(value)
+        pgMar.header = _coerce_length(value)
 
     def iter_inner_content(self) -> Iterator[CT_P | CT_Tbl]:
         """Generate all `w:p` and `w:tbl` elements in this section.
@@ -281,7 +291,7 @@ class CT_SectPr(BaseOxmlElement):
     @left_margin.setter
     def left_margin(self, value: int | Length | None):
         pgMar = self.get_or_add_pgMar()
-        pgMar.left = value if value is None or isinstance(value, Length) else Length(value)
+        pgMar.left = _coerce_length(value)
 
     @property
     def orientation(self) -> WD_ORIENTATION:
@@ -335,9 +345,18 @@ class CT_SectPr(BaseOxmlElement):
     @property
     def preceding_sectPr(self) -> CT_SectPr | None:
         """SectPr immediately preceding this one or None if this is the first."""
-        # -- [1] predicate returns list of zero or one value --
-        preceding_sectPrs = self.xpath("./preceding::w:sectPr[1]")
-        return preceding_sectPrs[0] if len(preceding_sectPrs) > 0 else None
+        # -- A section ends either with the `w:p` whose `w:pPr` holds its sectPr or, for
+        # -- the last section, with the `w:body/w:sectPr` itself. Any prior sectPr is in
+        # -- a paragraph preceding that point, so only those siblings need be checked.
+        parent = self.getparent()
+        terminus = parent.getparent() if parent is not None and parent.tag == _W_PPR else self
+        if terminus is None:
+            return None
+        for p in terminus.itersiblings(_W_P, preceding=True):
+            sectPr = _sectPr_of_p(p)
+            if sectPr is not None:
+                return sectPr
+        return None
 
     def remove_footerReference(self, type_: WD_HEADER_FOOTER) -> str:
         """Return rId of w:footerReference child of `type_` after removing it."""
@@ -402,7 +421,7 @@ class CT_SectPr(BaseOxmlElement):
 
     @titlePg_val.setter
     def titlePg_val(self, value: bool | None):
-        if value in [None, False]:
+        if not value:
             self._remove_titlePg()
         else:
             self.get_or_add_titlePg().val = True
@@ -434,15 +453,23 @@ class CT_SectType(BaseOxmlElement):
 # == HELPERS =========================================================================
 
 
+def _coerce_length(value: int | Length | None) -> Length | None:
+    """`value` as a |Length|, or |None| when `value` is |None|."""
+    return value if value is None or isinstance(value, Length) else Length(value)
+
+
+def _sectPr_of_p(p: etree._Element) -> CT_SectPr | None:  # pyright: ignore[reportPrivateUsage]
+    """The `w:pPr/w:sectPr` grandchild of `p`, or None if `p` does not end a section."""
+    pPr = p.find(_W_PPR)
+    return None if pPr is None else cast("CT_SectPr | None", pPr.find(_W_SECTPR))
+
+
 class _SectBlockElementIterator:
     """Generates the block-item XML elements in a section.
 
     A block-item element is a `CT_P` (paragraph) or a `CT_Tbl` (table).
     """
 
-    _compiled_blocks_xpath: etree.XPath | None = None
-    _compiled_count_xpath: etree.XPath | None = None
-
     def __init__(self, sectPr: CT_SectPr):
         self._sectPr = sectPr
 
@@ -453,85 +480,36 @@ class _SectBlockElementIterator:
 
     def _iter_sect_block_elements(self) -> Iterator[BlockElement]:
         """Generate each CT_P or CT_Tbl element in section."""
-        # -- General strategy is to get all block (<w;p> and <w:tbl>) elements from
-        # -- start of doc to and including this section, then compute the count of those
-        # -- elements that came from prior sections and skip that many to leave only the
-        # -- ones in this section. It's possible to express this "between here and
-        # -- there" (end of prior section and end of this one) concept in XPath, but it
-        # -- would be harder to follow because there are special cases (e.g. no prior
-        # -- section) and the boundary expressions are fairly hairy. I also believe it
-        # -- would be computationally more expensive than doing it this straighforward
-        # -- albeit (theoretically) slightly wasteful way.
-
-        sectPr, sectPrs = self._sectPr, self._sectPrs
-        sectPr_idx = sectPrs.index(sectPr)
-
-        # -- count block items belonging to prior sections --
-        n_blks_to_skip = (
-            0
-            if sectPr_idx == 0
-            else self._count_of_blocks_in_and_above_section(sectPrs[sectPr_idx - 1])
-        )
+        # -- A section's blocks are the `w:p` and `w:tbl` siblings between the end of
+        # -- the prior section and the end of this one. They are gathered by walking
+        # -- backward from this section's end until a paragraph holding a sectPr (the
+        # -- end of the prior section) or the start of the body is reached. This only
+        # -- visits the blocks in this section, where selecting every block from the
+        # -- start of the document and skipping those in prior sections did work
+        # -- proportional to the document size for each section.
+        sectPr = self._sectPr
+        parent = sectPr.getparent()
+        if parent is None:
+            return
+        if parent.tag == _W_PPR:
+            # -- a "p_sect" ends with (and includes) the paragraph its sectPr appears in --
+            terminal_p = parent.getparent()
+            if terminal_p is None:
+                return
+            blocks = [terminal_p]
+            start = terminal_p
+        elif parent.tag == _W_BODY:
+            # -- the last, "body_sect" section ends just before the body's sectPr --
+            blocks = []
+            start = sectPr
+        else:
+            return
 
-        # -- and skip those in set of all blks from doc start to end of this section --
-        for element in self._blocks_in_and_above_section(sectPr)[n_blks_to_skip:]:
-            yield element
-
-    def _blocks_in_and_above_section(self, sectPr: CT_SectPr) -> Sequence[BlockElement]:
-        """All ps and tbls in section defined by `sectPr` and all prior sections."""
-        if self._compiled_blocks_xpath is None:
-            self._compiled_blocks_xpath = etree.XPath(
-                self._blocks_in_and_above_section_xpath,
-                namespaces=nsmap,
-                regexp=False,
-            )
-        xpath = self._compiled_blocks_xpath
-        # -- XPath callable results are Any (basically), so need a cast. --
-        return cast(Sequence[BlockElement], xpath(sectPr))
-
-    @lazyproperty
-    def _blocks_in_and_above_section_xpath(self) -> str:
-        """XPath expr for ps and tbls in context of a sectPr and all prior sectPrs."""
-        # -- "p_sect" is a section with sectPr located at w:p/w:pPr/w:sectPr.
-        # -- "body_sect" is a section with sectPr located at w:body/w:sectPr. The last
-        # -- section in the document is a "body_sect". All others are of the "p_sect"
-        # -- variety. "term" means "terminal", like the last p or tbl in the section.
-        # -- "pred" means "predecessor", like a preceding p or tbl in the section.
-
-        # -- the terminal block in a p-based sect is the p the sectPr appears in --
-        p_sect_term_block = "./parent::w:pPr/parent::w:p"
-        # -- the terminus of a body-based sect is the sectPr itself (not a block) --
-        body_sect_term = "self::w:sectPr[parent::w:body]"
-        # -- all the ps and tbls preceding (but not including) the context node --
-        pred_ps_and_tbls = "preceding-sibling::*[self::w:p | self::w:tbl]"
-
-        # -- p_sect_term_block and body_sect_term(inus) are mutually exclusive. So the
-        # -- result is either the union of nodes found by the first two selectors or the
-        # -- nodes found by the last selector, never both.
-        return (
-            # -- include the p containing a sectPr --
-            f"{p_sect_term_block}"
-            # -- along with all the blocks that precede it --
-            f" | {p_sect_term_block}/{pred_ps_and_tbls}"
-            # -- or all the preceding blocks if sectPr is body-based (last sectPr) --
-            f" | {body_sect_term}/{pred_ps_and_tbls}"
-        )
+        for block in start.itersiblings(_W_P, _W_TBL, preceding=True):
+            if block.tag == _W_P and _sectPr_of_p(block) is not None:
+                break
+            blocks.append(block)
 
-    def _count_of_blocks_in_and_above_section(self, sectPr: CT_SectPr) -> int:
-        """All ps and tbls in section defined by `sectPr` and all prior sections."""
-        if self._compiled_count_xpath is None:
-            self._compiled_count_xpath = etree.XPath(
-                f"count({self._blocks_in_and_above_section_xpath})",
-                namespaces=nsmap,
-                regexp=False,
-            )
-        xpath = self._compiled_count_xpath
-        # -- numeric XPath results are always float, so need an int() conversion --
-        return int(cast(float, xpath(sectPr)))
-
-    @lazyproperty
-    def _sectPrs(self) -> Sequence[CT_SectPr]:
-        """All w:sectPr elements in document, in document-order."""
-        return self._sectPr.xpath(
-            "/w:document/w:body/w:p/w:pPr/w:sectPr | /w:document/w:body/w:sectPr",
-        )
+        # -- blocks were gathered in reverse document order --
+        for block in reversed(blocks):
+            yield cast(BlockElement, block)
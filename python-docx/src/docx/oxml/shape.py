@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
 from typing import TYPE_CHECKING, cast
 
 from docx.oxml.ns import nsdecls
@@ -76,11 +77,16 @@ class CT_Inline(BaseOxmlElement):
         "a:graphic"
     )
 
+    # -- parsed on first use, then deep-copied for each new inline --
+    _inline_template: CT_Inline | None = None
+
     @classmethod
     def new(cls, cx: Length, cy: Length, shape_id: int, pic: CT_Picture) -> CT_Inline:
         """Return a new ``<wp:inline>`` element populated with the values passed as
         parameters."""
-        inline = cast(CT_Inline, parse_xml(cls._inline_xml()))
+        if cls._inline_template is None:
+            cls._inline_template = cast(CT_Inline, parse_xml(cls._inline_xml()))
+        inline = deepcopy(cls._inline_template)
         inline.extent.cx = cx
         inline.extent.cy = cy
         inline.docPr.id = shape_id
@@ -144,12 +150,16 @@ class CT_Picture(BaseOxmlElement):
     )
     spPr: CT_ShapeProperties = OneAndOnlyOne("pic:spPr")  # pyright: ignore[reportAssignmentType]
 
+    _pic_template: CT_Picture | None = None
+
     @classmethod
     def new(cls, pic_id, filename, rId, cx, cy):
         """Return a new ``<pic:pic>`` element populated with the minimal contents
         required to define a viable picture element, based on the values passed as
         parameters."""
-        pic = parse_xml(cls._pic_xml())
+        if cls._pic_template is None:
+            cls._pic_template = cast(CT_Picture, parse_xml(cls._pic_xml()))
+        pic = deepcopy(cls._pic_template)
         pic.nvPicPr.cNvPr.id = pic_id
         pic.nvPicPr.cNvPr.name = filename
         pic.blipFill.blip.embed = rId
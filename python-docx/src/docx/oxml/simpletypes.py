@@ -119,7 +119,7 @@ class XsdBoolean(BaseSimpleType):
 
     @classmethod
     def convert_to_xml(cls, value: bool) -> str:
-        return {True: "1", False: "0"}[value]
+        return "1" if value else "0"
 
     @classmethod
     def validate(cls, value: Any) -> None:
@@ -177,28 +177,18 @@ class XsdUnsignedLong(BaseIntType):
         cls.validate_int_in_range(value, 0, 18446744073709551615)
 
 
-class ST_BrClear(XsdString):
-    @classmethod
-    def validate(cls, value: str) -> None:
-        cls.validate_string(value)
-        valid_values = ("none", "left", "right", "all")
-        if value not in valid_values:
-            raise ValueError("must be one of %s, got '%s'" % (valid_values, value))
+class ST_BrClear(XsdStringEnumeration):
+    _members = ("none", "left", "right", "all")
 
 
-class ST_BrType(XsdString):
-    @classmethod
-    def validate(cls, value: Any) -> None:
-        cls.validate_string(value)
-        valid_values = ("page", "column", "textWrapping")
-        if value not in valid_values:
-            raise ValueError("must be one of %s, got '%s'" % (valid_values, value))
+class ST_BrType(XsdStringEnumeration):
+    _members = ("page", "column", "textWrapping")
 
 
 class ST_Coordinate(BaseIntType):
     @classmethod
     def convert_from_xml(cls, str_value: str) -> Length:
-        if "i" in str_value or "m" in str_value or "p" in str_value:
+        if ST_UniversalMeasure.has_units(str_value):
             return ST_UniversalMeasure.convert_from_xml(str_value)
         return Emu(int(str_value))
 
@@ -222,6 +212,9 @@ class ST_DrawingElementId(XsdUnsignedInt):
 
 
 class ST_HexColor(BaseStringType):
+    # -- uppercase two-digit hex numeral for each possible byte value, indexed by that value --
+    _hex_by_byte = tuple("%02X" % i for i in range(256))
+
     @classmethod
     def convert_from_xml(  # pyright: ignore[reportIncompatibleMethodOverride]
         cls, str_value: str
@@ -236,7 +229,9 @@ class ST_HexColor(BaseStringType):
     ) -> str:
         """Keep alpha hex numerals all uppercase just for consistency."""
         # expecting 3-tuple of ints in range 0-255
-        return "%02X%02X%02X" % value
+        r, g, b = value
+        hex_by_byte = cls._hex_by_byte
+        return hex_by_byte[r] + hex_by_byte[g] + hex_by_byte[b]
 
     @classmethod
     def validate(cls, value: Any) -> None:
@@ -260,7 +255,7 @@ class ST_HpsMeasure(XsdUnsignedLong):
 
     @classmethod
     def convert_from_xml(cls, str_value: str) -> Length:
-        if "m" in str_value or "n" in str_value or "p" in str_value:
+        if ST_UniversalMeasure.has_units(str_value):
             return ST_UniversalMeasure.convert_from_xml(str_value)
         return Pt(int(str_value) / 2.0)
 
@@ -281,14 +276,25 @@ class ST_Merge(XsdStringEnumeration):
 
 
 class ST_OnOff(XsdBoolean):
+    # -- the complete set of valid values is small, so each one maps directly to its bool --
+    _bool_by_str_value = {
+        "1": True,
+        "0": False,
+        "true": True,
+        "false": False,
+        "on": True,
+        "off": False,
+    }
+
     @classmethod
     def convert_from_xml(cls, str_value: str) -> bool:
-        if str_value not in ("1", "0", "true", "false", "on", "off"):
+        value = cls._bool_by_str_value.get(str_value)
+        if value is None:
             raise InvalidXmlError(
                 "value must be one of '1', '0', 'true', 'false', 'on', or 'o"
                 "ff', got '%s'" % str_value
             )
-        return str_value in ("1", "true", "on")
+        return value
 
 
 class ST_PositiveCoordinate(XsdLong):
@@ -308,7 +314,7 @@ class ST_RelationshipId(XsdString):
 class ST_SignedTwipsMeasure(XsdInt):
     @classmethod
     def convert_from_xml(cls, str_value: str) -> Length:
-        if "i" in str_value or "m" in str_value or "p" in str_value:
+        if ST_UniversalMeasure.has_units(str_value):
             return ST_UniversalMeasure.convert_from_xml(str_value)
         return Twips(int(round(float(str_value))))
 
@@ -323,28 +329,18 @@ class ST_String(XsdString):
     pass
 
 
-class ST_TblLayoutType(XsdString):
-    @classmethod
-    def validate(cls, value: Any) -> None:
-        cls.validate_string(value)
-        valid_values = ("fixed", "autofit")
-        if value not in valid_values:
-            raise ValueError("must be one of %s, got '%s'" % (valid_values, value))
+class ST_TblLayoutType(XsdStringEnumeration):
+    _members = ("fixed", "autofit")
 
 
-class ST_TblWidth(XsdString):
-    @classmethod
-    def validate(cls, value: Any) -> None:
-        cls.validate_string(value)
-        valid_values = ("auto", "dxa", "nil", "pct")
-        if value not in valid_values:
-            raise ValueError("must be one of %s, got '%s'" % (valid_values, value))
+class ST_TblWidth(XsdStringEnumeration):
+    _members = ("auto", "dxa", "nil", "pct")
 
 
 class ST_TwipsMeasure(XsdUnsignedLong):
     @classmethod
     def convert_from_xml(cls, str_value: str) -> Length:
-        if "i" in str_value or "m" in str_value or "p" in str_value:
+        if ST_UniversalMeasure.has_units(str_value):
             return ST_UniversalMeasure.convert_from_xml(str_value)
         return Twips(int(str_value))
 
@@ -356,18 +352,28 @@ class ST_TwipsMeasure(XsdUnsignedLong):
 
 
 class ST_UniversalMeasure(BaseSimpleType):
+    _emu_per_unit = {
+        "mm": 36000,
+        "cm": 360000,
+        "in": 914400,
+        "pt": 12700,
+        "pc": 152400,
+        "pi": 152400,
+    }
+
+    @classmethod
+    def has_units(cls, str_value: str) -> bool:
+        """True when `str_value` ends in one of the universal-measure units, like "1.5in".
+
+        Units can only appear as the final two characters, so only those are checked.
+        """
+        return str_value[-2:] in cls._emu_per_unit
+
     @classmethod
     def convert_from_xml(cls, str_value: str) -> Emu:
         float_part, units_part = str_value[:-2], str_value[-2:]
         quantity = float(float_part)
-        multiplier = {
-            "mm": 36000,
-            "cm": 360000,
-            "in": 914400,
-            "pt": 12700,
-            "pc": 152400,
-            "pi": 152400,
-        }[units_part]
+        multiplier = cls._emu_per_unit[units_part]
         return Emu(int(round(quantity * multiplier)))
 
 
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from lxml import etree
+
 from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import nsmap, qn
 from docx.oxml.simpletypes import ST_DecimalNumber, ST_OnOff, ST_String
 from docx.oxml.xmlchemy import (
     BaseOxmlElement,
@@ -12,22 +15,34 @@ from docx.oxml.xmlchemy import (
     ZeroOrOne,
 )
 
+# -- compiled once at import; the looked-up value is bound as an XPath variable, so a
+# -- quote character in it cannot break the expression --
+_LSDEXCEPTION_BY_NAME_XPATH = etree.XPath("w:lsdException[@w:name=$name]", namespaces=nsmap)
+_STYLE_BY_ID_XPATH = etree.XPath("w:style[@w:styleId=$styleId]", namespaces=nsmap)
+_STYLE_BY_NAME_XPATH = etree.XPath("w:style[w:name/@w:val=$name]", namespaces=nsmap)
+
+# -- built-in style names whose style id is not just the name with spaces removed --
+_special_case_style_ids = {
+    "caption": "Caption",
+    "heading 1": "Heading1",
+    "heading 2": "Heading2",
+    "heading 3": "Heading3",
+    "heading 4": "Heading4",
+    "heading 5": "Heading5",
+    "heading 6": "Heading6",
+    "heading 7": "Heading7",
+    "heading 8": "Heading8",
+    "heading 9": "Heading9",
+}
+
 
 def styleId_from_name(name):
     """Return the style id corresponding to `name`, taking into account special-case
     names such as 'Heading 1'."""
-    return {
-        "caption": "Caption",
-        "heading 1": "Heading1",
-        "heading 2": "Heading2",
-        "heading 3": "Heading3",
-        "heading 4": "Heading4",
-        "heading 5": "Heading5",
-        "heading 6": "Heading6",
-        "heading 7": "Heading7",
-        "heading 8": "Heading8",
-        "heading 9": "Heading9",
-    }.get(name, name.replace(" ", ""))
+    styleId = _special_case_style_ids.get(name)
+    if styleId is not None:
+        return styleId
+    return name.replace(" ", "")
 
 
 class CT_LatentStyles(BaseOxmlElement):
@@ -54,7 +69,7 @@ class CT_LatentStyles(BaseOxmlElement):
 
     def get_by_name(self, name):
         """Return the `w:lsdException` child having `name`, or |None| if not found."""
-        found = self.xpath('w:lsdException[@w:name="%s"]' % name)
+        found = _LSDEXCEPTION_BY_NAME_XPATH(self, name=name)
         if not found:
             return None
         return found[0]
@@ -291,30 +306,22 @@ class CT_Styles(BaseOxmlElement):
 
     def default_for(self, style_type):
         """Return `w:style[@w:type="*{style_type}*][-1]` or |None| if not found."""
-        default_styles_for_type = [
-            s for s in self._iter_styles() if s.type == style_type and s.default
-        ]
-        if not default_styles_for_type:
-            return None
-        # spec calls for last default in document order
-        return default_styles_for_type[-1]
+        # -- spec calls for last default in document order, so search from the end --
+        for style in self.iterchildren(qn("w:style"), reversed=True):
+            if style.type == style_type and style.default:
+                return style
+        return None
 
     def get_by_id(self, styleId: str) -> CT_Style | None:
         """`w:style` child where @styleId = `styleId`.
 
         |None| if not found.
         """
-        xpath = f'w:style[@w:styleId="{styleId}"]'
-        return next(iter(self.xpath(xpath)), None)
+        return next(iter(_STYLE_BY_ID_XPATH(self, styleId=styleId)), None)
 
     def get_by_name(self, name: str) -> CT_Style | None:
         """`w:style` child with `w:name` grandchild having value `name`.
 
         |None| if not found.
         """
-        xpath = 'w:style[w:name/@w:val="%s"]' % name
-        return next(iter(self.xpath(xpath)), None)
-
-    def _iter_styles(self):
-        """Generate each of the `w:style` child elements in document order."""
-        return (style for style in self.xpath("w:style"))
+        return next(iter(_STYLE_BY_NAME_XPATH(self, name=name)), None)
@@ -84,7 +84,7 @@ class CT_Row(BaseOxmlElement):
         # -- account for omitted cells at the start of the row --
         remaining_offset = grid_offset - self.grid_before
 
-        for tc in self.tc_lst:
+        for tc in self.iterchildren(qn("w:tc")):
             # -- We've gone past grid_offset without finding a tc, no sense searching further. --
             if remaining_offset < 0:
                 break
@@ -100,8 +100,7 @@ class CT_Row(BaseOxmlElement):
     @property
     def tr_idx(self) -> int:
         """Index of this `w:tr` element within its parent `w:tbl` element."""
-        tbl = cast(CT_Tbl, self.getparent())
-        return tbl.tr_lst.index(self)
+        return sum(1 for _ in self.itersiblings(qn("w:tr"), preceding=True))
 
     @property
     def trHeight_hRule(self) -> WD_ROW_HEIGHT_RULE | None:
@@ -184,9 +183,9 @@ class CT_Tbl(BaseOxmlElement):
         Each cell in the first row is generated, followed by each cell in the second
         row, etc.
         """
-        for tr in self.tr_lst:
-            for tc in tr.tc_lst:
-                yield tc
+        # -- walk direct children only; `self.iter()` would also reach into nested tables --
+        for tr in self.iterchildren(qn("w:tr")):
+            yield from tr.iterchildren(qn("w:tc"))
 
     @classmethod
     def new_tbl(cls, rows: int, cols: int, width: Length) -> CT_Tbl:
@@ -234,11 +233,8 @@ class CT_Tbl(BaseOxmlElement):
 
     @classmethod
     def _tblGrid_xml(cls, col_count: int, col_width: Length) -> str:
-        xml = "  <w:tblGrid>\n"
-        for _ in range(col_count):
-            xml += '    <w:gridCol w:w="%d"/>\n' % col_width.twips
-        xml += "  </w:tblGrid>\n"
-        return xml
+        gridCol_xml = f'    <w:gridCol w:w="{col_width.twips}"/>\n'
+        return f"  <w:tblGrid>\n{gridCol_xml * col_count}  </w:tblGrid>\n"
 
     @classmethod
     def _trs_xml(cls, row_count: int, col_count: int, col_width: Length) -> str:
@@ -278,8 +274,7 @@ class CT_TblGridCol(BaseOxmlElement):
     @property
     def gridCol_idx(self) -> int:
         """Index of this `w:gridCol` element within its parent `w:tblGrid` element."""
-        tblGrid = cast(CT_TblGrid, self.getparent())
-        return tblGrid.gridCol_lst.index(self)
+        return sum(1 for _ in self.itersiblings(qn("w:gridCol"), preceding=True))
 
 
 class CT_TblLayoutType(BaseOxmlElement):
@@ -148,7 +148,7 @@ class BaseAttribute:
         # -- assign unconditionally to overwrite element name definition --
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
+    @lazyproperty
     def _clark_name(self):
         if ":" in self._attr_name:
             return qn(self._attr_name)
@@ -195,14 +195,16 @@ class OptionalAttribute(BaseAttribute):
         self,
     ) -> Callable[[BaseOxmlElement], Any | None]:
         """Function suitable for `__get__()` method on attribute property descriptor."""
+        # -- resolved once here rather than looked up on each attribute read --
+        clark_name, default, from_xml = self._clark_name, self._default, self._simple_type.from_xml
 
         def get_attr_value(
             obj: BaseOxmlElement,
         ) -> Any | None:
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -248,14 +250,16 @@ class RequiredAttribute(BaseAttribute):
     @property
     def _getter(self) -> Callable[[BaseOxmlElement], Any]:
         """function object suitable for "get" side of attr property descriptor."""
+        # -- resolved once here rather than looked up on each attribute read --
+        clark_name, from_xml = self._clark_name, self._simple_type.from_xml
 
         def get_attr_value(obj: BaseOxmlElement) -> Any | None:
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" % (self._attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -389,8 +393,10 @@ class _BaseChildElement:
         if not present.
         """
 
+        clark_name = qn(self._nsptagname)
+
         def get_child_element(obj: BaseOxmlElement):
-            return obj.find(qn(self._nsptagname))
+            return obj.find(clark_name)
 
         get_child_element.__doc__ = (
             "``<%s>`` child element or |None| if not present." % self._nsptagname
@@ -406,8 +412,10 @@ class _BaseChildElement:
         """Return a function object suitable for the "get" side of a list property
         descriptor."""
 
+        clark_name = qn(self._nsptagname)
+
         def get_child_element_list(obj: BaseOxmlElement):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(clark_name)
 
         get_child_element_list.__doc__ = (
             "A list containing each of the ``<%s>`` child elements, in the o"
@@ -509,8 +517,10 @@ class OneAndOnlyOne(_BaseChildElement):
         """Return a function object suitable for the "get" side of the property
         descriptor."""
 
+        clark_name = qn(self._nsptagname)
+
         def get_child_element(obj: BaseOxmlElement):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(clark_name)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" % self._nsptagname
@@ -567,8 +577,10 @@ class ZeroOrOne(_BaseChildElement):
         """Add a ``get_or_add_x()`` method to the element class for this child
         element."""
 
+        clark_name = qn(self._nsptagname)
+
         def get_or_add_child(obj: BaseOxmlElement):
-            child = getattr(obj, self._prop_name)
+            child = obj.find(clark_name)
             if child is None:
                 add_method = getattr(obj, self._add_method_name)
                 child = add_method()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Tuple, cast
+from typing import IO, TYPE_CHECKING, List, Tuple, cast
+
+from lxml import etree
 
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.part import XmlPart
@@ -15,6 +17,9 @@ if TYPE_CHECKING:
     from docx.parts.document import DocumentPart
     from docx.styles.style import BaseStyle
 
+# -- compiled once rather than on each `StoryPart.next_id` access --
+_ID_ATTRS_XPATH = etree.XPath("//@id")
+
 
 class StoryPart(XmlPart):
     """Base class for story parts.
@@ -81,7 +86,7 @@ class StoryPart(XmlPart):
         the existing id sequence are not filled. The id attribute value is unique in the
         document, without regard to the element type it appears on.
         """
-        id_str_lst = self._element.xpath("//@id")
+        id_str_lst = cast(List[str], _ID_ATTRS_XPATH(self._element))
         used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
         if not used_ids:
             return 1
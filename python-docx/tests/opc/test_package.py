@@ -40,6 +40,7 @@ class DescribeOpcPackage:
         # verify -----------------------
         PackageReader_.from_file.assert_called_once_with(pkg_file)
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg, PartFactory_)
+        pkg_reader.close.assert_called_once_with()
         assert isinstance(pkg, OpcPackage)
 
     def it_initializes_its_rels_collection_on_first_reference(self, Relationships_):
@@ -99,6 +100,33 @@ class DescribeOpcPackage:
         assert part2 in pkg.iter_parts()
         assert len(list(pkg.iter_parts())) == 2
 
+    def it_generates_the_same_parts_on_each_call_to_iter_parts(self, rels_prop_: Mock):
+        part1, part2 = (Mock(name="part1"), Mock(name="part2"))
+        part1.rels = {1: Mock(name="rel1", is_external=False, target_part=part2)}
+        part2.rels = {}
+        rels_prop_.return_value = {1: Mock(name="rel2", is_external=False, target_part=part1)}
+        pkg = OpcPackage()
+
+        assert list(pkg.iter_parts()) == [part1, part2]
+        assert list(pkg.iter_parts()) == [part1, part2]
+        assert OpcPackage().parts == [part1, part2]
+
+    def it_generates_rels_in_depth_first_order(self, rels_prop_: Mock):
+        part1, part2, part3 = (Mock(name="part1"), Mock(name="part2"), Mock(name="part3"))
+        rel1 = Mock(name="rel1", is_external=False, target_part=part1)
+        rel2 = Mock(name="rel2", is_external=False, target_part=part2)
+        rel3 = Mock(name="rel3", is_external=False, target_part=part3)
+        rel4 = Mock(name="rel4", is_external=False, target_part=part1)
+        rel5 = Mock(name="rel5", is_external=True)
+        part1.rels = {1: rel2, 2: rel5}
+        part2.rels = {1: rel4}
+        part3.rels = {}
+        rels_prop_.return_value = {1: rel1, 2: rel3}
+        pkg = OpcPackage()
+
+        assert list(pkg.iter_rels()) == [rel1, rel2, rel4, rel5, rel3]
+        assert list(pkg.iter_parts()) == [part1, part2, part3]
+
     def it_can_find_the_next_available_vector_partname(
         self, next_partname_fixture, iter_parts_, PackURI_, packuri_
     ):
@@ -113,6 +141,48 @@ class DescribeOpcPackage:
         PackURI_.assert_called_once_with(expected_value)
         assert partname is packuri_
 
+    def it_walks_the_package_only_once_to_find_vector_partnames(self, iter_parts_, request):
+        iter_parts_.return_value = iter(
+            [instance_mock(request, Part, partname="/foo/bar/baz%d.xml" % n) for n in (1, 3)]
+        )
+        package = OpcPackage()
+
+        partnames = [package.next_partname("/foo/bar/baz%d.xml") for _ in range(3)]
+
+        assert partnames == ["/foo/bar/baz2.xml", "/foo/bar/baz4.xml", "/foo/bar/baz5.xml"]
+        iter_parts_.assert_called_once_with(package)
+
+    def it_caches_the_main_document_part_until_a_new_one_is_related(
+        self, part_related_by_: Mock, rels_prop_: Mock, rels_: Mock, part_: Mock
+    ):
+        rels_prop_.return_value = rels_
+        part_related_by_.return_value = part_
+        pkg = OpcPackage()
+
+        assert pkg.main_document_part is part_
+        assert pkg.main_document_part is part_
+        part_related_by_.assert_called_once_with(pkg, RT.OFFICE_DOCUMENT)
+
+        pkg.relate_to(part_, RT.OFFICE_DOCUMENT)
+        pkg.main_document_part
+
+        assert part_related_by_.call_count == 2
+
+    def it_keeps_vector_partnames_in_step_with_parts_related_outside_next_partname(self):
+        package = OpcPackage()
+        document_part = Part(PackURI("/word/document.xml"), "ct", package=package)
+        package.relate_to(document_part, RT.OFFICE_DOCUMENT)
+        header_1 = Part(package.next_partname("/word/header%d.xml"), "ct", package=package)
+        document_part.relate_to(header_1, RT.HEADER)
+        header_2 = Part(PackURI("/word/header2.xml"), "ct", package=package)
+        rId = document_part.relate_to(header_2, RT.HEADER)
+
+        assert package.next_partname("/word/header%d.xml") == "/word/header3.xml"
+
+        document_part.drop_rel(rId)
+
+        assert package.next_partname("/word/header%d.xml") == "/word/header2.xml"
+
     def it_can_find_a_part_related_by_reltype(self, related_part_fixture_):
         pkg, reltype, related_part_ = related_part_fixture_
         related_part = pkg.part_related_by(reltype)
@@ -125,6 +195,20 @@ class DescribeOpcPackage:
         parts_prop_.return_value = parts_
         pkg = OpcPackage()
         pkg.save(pkg_file_)
+        parts_prop_.assert_called_once_with()
+        for part in parts_:
+            part.before_marshal.assert_called_once_with()
+        PackageWriter_.write.assert_called_once_with(pkg_file_, pkg.rels, parts_)
+
+    def it_walks_the_rels_graph_only_once_when_saving(
+        self, pkg_file_: Mock, PackageWriter_: Mock, iter_parts_: Mock, parts_: list[Mock]
+    ):
+        iter_parts_.return_value = iter(parts_)
+        pkg = OpcPackage()
+
+        pkg.save(pkg_file_)
+
+        iter_parts_.assert_called_once_with(pkg)
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(pkg_file_, pkg.rels, parts_)
@@ -28,6 +28,11 @@ class DescribePackURI:
         pack_uri = PackURI.from_rel_ref(baseURI, relative_ref)
         assert pack_uri == "/ppt/slideLayouts/slideLayout1.xml"
 
+    def it_returns_the_existing_instance_for_an_equal_pack_uri_str(self):
+        pack_uri = PackURI("/word/document.xml")
+        assert PackURI("/word/document.xml") is pack_uri
+        assert PackURI("/word/styles.xml") is not pack_uri
+
     def it_should_raise_on_construct_with_bad_pack_uri_str(self):
         with pytest.raises(ValueError, match="PackURI must begin with slash"):
             PackURI("foobar")
@@ -74,6 +79,11 @@ class DescribePackURI:
                 "/ppt/slideLayouts/slideLayout1.xml",
                 "../slideLayouts/slideLayout1.xml",
             ),
+            ("/word", "/word/media/image1.png", "media/image1.png"),
+            ("/customXml/item", "/word/document.xml", "../../word/document.xml"),
+            ("/ppt/slide", "/ppt/slides/slide1.xml", "../slides/slide1.xml"),
+            ("/word/", "/word/media/image1.png", "media/image1.png"),
+            ("/word/a/..", "/word/document.xml", "document.xml"),
         )
         for baseURI, uri_str, expected_relative_ref in cases:
             pack_uri = PackURI(uri_str)
@@ -87,3 +97,9 @@ class DescribePackURI:
         )
         for pack_uri, expected_rels_uri in self.cases(expected_values):
             assert pack_uri.rels_uri == expected_rels_uri
+
+    def it_computes_its_rels_uri_only_once(self):
+        pack_uri = PackURI("/word/document.xml")
+        rels_uri = pack_uri.rels_uri
+        assert isinstance(rels_uri, PackURI)
+        assert pack_uri.rels_uri is rels_uri
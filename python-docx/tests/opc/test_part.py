@@ -237,15 +237,10 @@ class DescribePartFactory:
     def blob_2_(self, request):
         return instance_mock(request, str)
 
-    @pytest.fixture
-    def cls_method_fn_(self, request, cls_selector_fn_):
-        return function_mock(request, "docx.opc.part.cls_method_fn", return_value=cls_selector_fn_)
-
     @pytest.fixture
     def cls_selector_fixture(
         self,
         cls_selector_fn_,
-        cls_method_fn_,
         part_load_params,
         CustomPartClass_,
         part_of_custom_type_,
@@ -2,7 +2,7 @@
 
 import hashlib
 import io
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, BadZipFile, ZipFile
 
 import pytest
 
@@ -17,7 +17,7 @@ from docx.opc.phys_pkg import (
 )
 
 from ..unitutil.file import absjoin, test_file_dir
-from ..unitutil.mock import Mock, class_mock, loose_mock
+from ..unitutil.mock import Mock, class_mock, function_mock, loose_mock
 
 test_docx_path = absjoin(test_file_dir, "test.docx")
 dir_pkg_path = absjoin(test_file_dir, "expanded_docx")
@@ -73,6 +73,7 @@ class DescribeZipPkgReader:
     def it_is_used_by_PhysPkgReader_when_pkg_is_a_zip(self):
         phys_reader = PhysPkgReader(zip_pkg_path)
         assert isinstance(phys_reader, _ZipPkgReader)
+        phys_reader.close()
 
     def it_is_used_by_PhysPkgReader_when_pkg_is_a_stream(self):
         with open(zip_pkg_path, "rb") as stream:
@@ -92,6 +93,34 @@ class DescribeZipPkgReader:
         # verify -----------------------
         zipf.close.assert_called_once_with()
 
+    def it_opens_a_pkg_file_path_with_a_large_buffer(self, ZipFile_, open_):
+        zip_pkg_reader = _ZipPkgReader(zip_pkg_path)
+
+        open_.assert_called_once_with(zip_pkg_path, "rb", buffering=256 * 1024)
+        ZipFile_.assert_called_once_with(open_.return_value, "r")
+        zip_pkg_reader.close()
+        open_.return_value.close.assert_called_once_with()
+
+    def it_closes_a_pkg_file_it_opened_when_it_is_not_a_zip(self, ZipFile_, open_):
+        ZipFile_.side_effect = BadZipFile("File is not a zip file")
+
+        with pytest.raises(BadZipFile):
+            _ZipPkgReader(zip_pkg_path)
+
+        open_.return_value.close.assert_called_once_with()
+
+    def it_buffers_an_unbuffered_pkg_stream(self):
+        raw = io.FileIO(zip_pkg_path, "rb")
+        zip_pkg_reader = _ZipPkgReader(raw)
+
+        blob = zip_pkg_reader.blob_for(PackURI("/word/document.xml"))
+        zip_pkg_reader.close()
+
+        sha1 = hashlib.sha1(blob).hexdigest()
+        assert sha1 == "b9b4a98bcac7c5a162825b60c3db7df11e02ac5f"
+        assert raw.closed is False
+        raw.close()
+
     def it_can_retrieve_the_blob_for_a_pack_uri(self, phys_reader):
         pack_uri = PackURI("/word/document.xml")
         blob = phys_reader.blob_for(pack_uri)
@@ -112,6 +141,18 @@ class DescribeZipPkgReader:
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_checks_for_a_rels_item_without_trying_to_read_it(self, ZipFile_):
+        zipf = ZipFile_.return_value
+        zipf.namelist.return_value = ["_rels/.rels", "word/document.xml"]
+        zip_pkg_reader = _ZipPkgReader(None)
+
+        rels_xml = zip_pkg_reader.rels_xml_for(PackURI("/word/document.xml"))
+        zip_pkg_reader.rels_xml_for(PackURI("/word/styles.xml"))
+
+        assert rels_xml is None
+        zipf.namelist.assert_called_once_with()
+        zipf.read.assert_not_called()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(scope="class")
@@ -129,12 +170,29 @@ class DescribeZipPkgWriter:
     def it_is_used_by_PhysPkgWriter_unconditionally(self, tmp_docx_path):
         phys_writer = PhysPkgWriter(tmp_docx_path)
         assert isinstance(phys_writer, _ZipPkgWriter)
+        phys_writer.close()
 
     def it_opens_pkg_file_zip_on_construction(self, ZipFile_):
         pkg_file = Mock(name="pkg_file")
         _ZipPkgWriter(pkg_file)
         ZipFile_.assert_called_once_with(pkg_file, "w", compression=ZIP_DEFLATED)
 
+    def it_opens_a_pkg_file_path_with_a_large_buffer(self, ZipFile_, open_):
+        zip_pkg_writer = _ZipPkgWriter("foo/bar.docx")
+
+        open_.assert_called_once_with("foo/bar.docx", "wb", buffering=256 * 1024)
+        ZipFile_.assert_called_once_with(open_.return_value, "w", compression=ZIP_DEFLATED)
+        zip_pkg_writer.close()
+        open_.return_value.close.assert_called_once_with()
+
+    def it_closes_a_pkg_file_it_opened_when_the_zip_cannot_be_created(self, ZipFile_, open_):
+        ZipFile_.side_effect = ValueError("bad mode")
+
+        with pytest.raises(ValueError, match="bad mode"):
+            _ZipPkgWriter("foo/bar.docx")
+
+        open_.return_value.close.assert_called_once_with()
+
     def it_can_be_closed(self, ZipFile_):
         # mockery ----------------------
         zipf = ZipFile_.return_value
@@ -144,6 +202,20 @@ class DescribeZipPkgWriter:
         # verify -----------------------
         zipf.close.assert_called_once_with()
 
+    def it_buffers_an_unbuffered_pkg_stream(self, tmp_docx_path):
+        pack_uri = PackURI("/part/name.xml")
+        blob = b"<BlobbityFooBlob/>"
+        raw = io.FileIO(tmp_docx_path, "wb")
+
+        pkg_writer = _ZipPkgWriter(raw)
+        pkg_writer.write(pack_uri, blob)
+        pkg_writer.close()
+
+        assert raw.closed is False
+        raw.close()
+        with ZipFile(tmp_docx_path, "r") as zipf:
+            assert zipf.read(pack_uri.membername) == blob
+
     def it_can_write_a_blob(self, pkg_file):
         # setup ------------------------
         pack_uri = PackURI("/part/name.xml")
@@ -160,6 +232,29 @@ class DescribeZipPkgWriter:
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    @pytest.mark.parametrize(
+        ("partname", "blob", "expected_compress_type"),
+        [
+            ("/part/name.xml", b"<Tiny/>", ZIP_STORED),
+            ("/part/name.xml", b"<Big>%s</Big>" % (b"x" * 256), ZIP_DEFLATED),
+            ("/word/media/image1.png", b"x" * 512, ZIP_STORED),
+            ("/word/media/image2.JPEG", b"x" * 512, ZIP_STORED),
+            ("/word/media/image3.emf", b"x" * 512, ZIP_DEFLATED),
+        ],
+    )
+    def it_only_deflates_a_blob_when_that_can_pay_off(
+        self, pkg_file, partname, blob, expected_compress_type
+    ):
+        pack_uri = PackURI(partname)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(pack_uri, blob)
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.getinfo(pack_uri.membername).compress_type == expected_compress_type
+            assert zipf.read(pack_uri.membername) == blob
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -177,6 +272,11 @@ def tmp_docx_path(tmpdir):
     return str(tmpdir.join("test_python-docx.docx"))
 
 
+@pytest.fixture
+def open_(request):
+    return function_mock(request, "docx.opc.phys_pkg.open", autospec=False, create=True)
+
+
 @pytest.fixture
 def ZipFile_(request):
     return class_mock(request, "docx.opc.phys_pkg.ZipFile")
@@ -1,5 +1,9 @@
 """Unit test suite for docx.opc.pkgreader module."""
 
+import gc
+from pathlib import Path
+from zipfile import ZipFile
+
 import pytest
 
 from docx.opc.constants import CONTENT_TYPE as CT
@@ -47,10 +51,41 @@ class DescribePackageReader:
         _load_serialized_parts.assert_called_once_with(
             phys_reader, pkg_srels, content_types
         )
-        phys_reader.close.assert_called_once_with()
-        _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts)
+        phys_reader.close.assert_not_called()
+        _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts, phys_reader)
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_closes_its_phys_reader_when_the_package_cannot_be_loaded(self, PhysPkgReader_, from_xml):
+        phys_reader = PhysPkgReader_.return_value
+        from_xml.side_effect = KeyError("[Content_Types].xml")
+
+        with pytest.raises(KeyError):
+            PackageReader.from_file(Mock(name="pkg_file"))
+
+        phys_reader.close.assert_called_once_with()
+
+    def it_leaves_an_unbuffered_pkg_stream_open_when_the_package_cannot_be_loaded(
+        self, tmp_path: Path
+    ):
+        pkg_path = tmp_path / "no-content-types.docx"
+        with ZipFile(pkg_path, "w") as zipf:
+            zipf.writestr("word/document.xml", b"<w:document/>")
+
+        with open(pkg_path, "rb", buffering=0) as raw:
+            with pytest.raises(KeyError):
+                PackageReader.from_file(raw)
+            gc.collect()
+
+            assert raw.closed is False
+
+    def it_closes_its_phys_reader_when_closed(self):
+        phys_reader = Mock(name="phys_reader")
+        pkg_reader = PackageReader(None, [], [], phys_reader)
+
+        pkg_reader.close()
+
+        phys_reader.close.assert_called_once_with()
+
     def it_can_iterate_over_the_serialized_parts(self, iter_sparts_fixture):
         pkg_reader, expected_iter_spart_items = iter_sparts_fixture
         iter_spart_items = list(pkg_reader.iter_sparts())
@@ -80,10 +115,10 @@ class DescribePackageReader:
     def it_can_load_serialized_parts(self, _SerializedPart_, _walk_phys_parts):
         # test data --------------------
         test_data = (
-            ("/part/name1.xml", "app/vnd.type_1", "reltype1", "<Part_1/>", "srels_1"),
-            ("/part/name2.xml", "app/vnd.type_2", "reltype2", "<Part_2/>", "srels_2"),
+            ("/part/name1.xml", "app/vnd.type_1", "reltype1", "srels_1"),
+            ("/part/name2.xml", "app/vnd.type_2", "reltype2", "srels_2"),
         )
-        iter_vals = [(t[0], t[2], t[3], t[4]) for t in test_data]
+        iter_vals = [(t[0], t[2], t[3]) for t in test_data]
         content_types = {t[0]: t[1] for t in test_data}
         # mockery ----------------------
         phys_reader = Mock(name="phys_reader")
@@ -99,15 +134,11 @@ class DescribePackageReader:
         )
         # verify -----------------------
         expected_calls = [
-            call(
-                "/part/name1.xml", "app/vnd.type_1", "<Part_1/>", "reltype1", "srels_1"
-            ),
-            call(
-                "/part/name2.xml", "app/vnd.type_2", "<Part_2/>", "reltype2", "srels_2"
-            ),
+            call("/part/name1.xml", "app/vnd.type_1", "reltype1", phys_reader, "srels_1"),
+            call("/part/name2.xml", "app/vnd.type_2", "reltype2", phys_reader, "srels_2"),
         ]
         assert _SerializedPart_.call_args_list == expected_calls
-        assert retval == expected_sparts
+        assert retval == list(expected_sparts)
 
     def it_can_walk_phys_pkg_parts(self, _srels_for):
         # test data --------------------
@@ -124,7 +155,6 @@ class DescribePackageReader:
             "/part/name2.xml",
             "/part/name3.xml",
         )
-        part_1_blob, part_2_blob, part_3_blob = ("<Part_1/>", "<Part_2/>", "<Part_3/>")
         reltype1, reltype2, reltype3 = ("reltype1", "reltype2", "reltype3")
         srels = [
             Mock(name="rId1", is_external=True),
@@ -160,16 +190,21 @@ class DescribePackageReader:
         # mockery ----------------------
         phys_reader = Mock(name="phys_reader")
         _srels_for.side_effect = [part_1_srels, part_2_srels, part_3_srels]
-        phys_reader.blob_for.side_effect = [part_1_blob, part_2_blob, part_3_blob]
         # exercise ---------------------
         generated_tuples = list(PackageReader._walk_phys_parts(phys_reader, pkg_srels))
         # verify -----------------------
         expected_tuples = [
-            (partname_1, part_1_blob, reltype1, part_1_srels),
-            (partname_2, part_2_blob, reltype2, part_2_srels),
-            (partname_3, part_3_blob, reltype3, part_3_srels),
+            (partname_1, reltype1, part_1_srels),
+            (partname_2, reltype2, part_2_srels),
+            (partname_3, reltype3, part_3_srels),
         ]
         assert generated_tuples == expected_tuples
+        assert _srels_for.call_args_list == [
+            call(phys_reader, partname_1),
+            call(phys_reader, partname_2),
+            call(phys_reader, partname_3),
+        ]
+        phys_reader.blob_for.assert_not_called()
 
     def it_can_retrieve_srels_for_a_source_uri(self, _SerializedRelationships_):
         # mockery ----------------------
@@ -300,12 +335,6 @@ class Describe_ContentTypeMap:
         with pytest.raises(KeyError):
             ct_map[PackURI("/!blat/rhumba.1x&")]
 
-    def it_should_raise_on_key_not_instance_of_PackURI(self):
-        ct_map = _ContentTypeMap()
-        ct_map._overrides = {PackURI("/part/name1.xml"): "app/vnd.type1"}
-        with pytest.raises(KeyError):
-            ct_map["/part/name1.xml"]
-
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -386,17 +415,27 @@ class Describe_SerializedPart:
         partname = "/part/name.xml"
         content_type = "app/vnd.type"
         reltype = "http://rel/type"
-        blob = "<Part/>"
+        phys_reader = Mock(name="phys_reader")
         srels = "srels proxy"
         # exercise ---------------------
-        spart = _SerializedPart(partname, content_type, reltype, blob, srels)
+        spart = _SerializedPart(partname, content_type, reltype, phys_reader, srels)
         # verify -----------------------
         assert spart.partname == partname
         assert spart.content_type == content_type
         assert spart.reltype == reltype
-        assert spart.blob == blob
         assert spart.srels == srels
 
+    def it_reads_its_blob_from_the_phys_reader_on_demand(self):
+        phys_reader = Mock(name="phys_reader")
+        phys_reader.blob_for.return_value = b"<Part/>"
+        spart = _SerializedPart("/part/name.xml", "app/vnd.type", "reltype", phys_reader, [])
+        phys_reader.blob_for.assert_not_called()
+
+        blob = spart.blob
+
+        phys_reader.blob_for.assert_called_once_with("/part/name.xml")
+        assert blob == b"<Part/>"
+
 
 class Describe_SerializedRelationship:
     def it_remembers_construction_values(self):
@@ -490,6 +529,11 @@ class Describe_SerializedRelationships:
         assert _SerializedRelationship_.call_args_list == expected_calls
         assert isinstance(srels, _SerializedRelationships)
 
+    def it_shares_one_empty_instance_for_a_missing_rels_item(self):
+        srels = _SerializedRelationships.load_from_xml("/", None)
+        assert len(srels) == 0
+        assert _SerializedRelationships.load_from_xml("/word", None) is srels
+
     def it_should_be_iterable(self):
         srels = _SerializedRelationships()
         try:
@@ -4,6 +4,9 @@
 
 from __future__ import annotations
 
+import gc
+from pathlib import Path
+
 import pytest
 
 from docx.opc.constants import CONTENT_TYPE as CT
@@ -44,6 +47,27 @@ class DescribePackageWriter:
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
+    def it_closes_its_phys_writer_when_writing_fails(self, PhysPkgWriter_, _write_methods):
+        phys_writer = PhysPkgWriter_.return_value
+        _write_methods._write_parts.side_effect = ValueError("no blob")
+
+        with pytest.raises(ValueError, match="no blob"):
+            PackageWriter.write(Mock(name="pkg_file"), Mock(name="pkg_rels"), [])
+
+        phys_writer.close.assert_called_once_with()
+
+    def it_leaves_an_unbuffered_pkg_stream_open_when_writing_fails(
+        self, tmp_path: Path, _write_methods
+    ):
+        _write_methods._write_parts.side_effect = ValueError("no blob")
+
+        with open(tmp_path / "out.docx", "wb", buffering=0) as raw:
+            with pytest.raises(ValueError, match="no blob"):
+                PackageWriter.write(raw, Mock(name="pkg_rels"), [])
+            gc.collect()
+
+            assert raw.closed is False
+
     def it_can_write_a_content_types_stream(self, write_cti_fixture):
         _ContentTypesItem_, parts_, phys_pkg_writer_, blob_ = write_cti_fixture
         PackageWriter._write_content_types_stream(phys_pkg_writer_, parts_)
@@ -86,6 +86,18 @@ class DescribeRelationships:
         rels, reltype, part, new_rel = rels_with_missing_rel_
         assert rels.get_or_add(reltype, part) == new_rel
 
+    def it_keeps_matching_in_step_with_removed_relationships(self, reltype, url):
+        rels = Relationships(None)
+        rels.add_relationship(reltype, url, "rId1", is_external=True)
+        rels.add_relationship(reltype, url, "rId2", is_external=True)
+
+        assert rels.get_or_add_ext_rel(reltype, url) == "rId1"
+        del rels["rId1"]
+        assert rels.get_or_add_ext_rel(reltype, url) == "rId2"
+        del rels["rId2"]
+        assert rels.get_or_add_ext_rel(reltype, url) == "rId1"
+        assert len(rels) == 1
+
     def it_can_find_or_add_an_external_relationship(
         self, add_matching_ext_rel_fixture_
     ):
@@ -126,6 +138,24 @@ class DescribeRelationships:
         next_rId = rels._next_rId
         assert next_rId == expected_next_rId
 
+    def it_reuses_an_rId_freed_by_a_removed_relationship(self, reltype):
+        rels = Relationships(None)
+        for n in range(1, 4):
+            rels.get_or_add_ext_rel(reltype, "http://url/%d" % n)
+
+        del rels["rId2"]
+
+        assert rels.get_or_add_ext_rel(reltype, "http://url/4") == "rId2"
+        assert rels.get_or_add_ext_rel(reltype, "http://url/5") == "rId4"
+
+    def it_never_numbers_from_below_rId1_after_rId0_is_removed(self, reltype):
+        rels = Relationships(None)
+        rels.add_relationship(reltype, "http://url/0", "rId0", is_external=True)
+
+        del rels["rId0"]
+
+        assert rels._next_rId == "rId1"
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -26,6 +26,7 @@ class DescribeCT_Body:
             ("w:body/w:tbl", "w:body"),
             ("w:body/w:sectPr", "w:body/w:sectPr"),
             ("w:body/(w:p, w:sectPr)", "w:body/w:sectPr"),
+            ("w:body/(w:p, w:tbl, w:p, w:sectPr)", "w:body/w:sectPr"),
         ]
     )
     def clear_fixture(self, request):
@@ -36,10 +37,12 @@ class DescribeCT_Body:
 
     @pytest.fixture
     def section_break_fixture(self):
-        body = element("w:body/w:sectPr/w:type{w:val=foobar}")
+        body = element(
+            "w:body/w:sectPr/(w:headerReference,w:type{w:val=foobar},w:footerReference)"
+        )
         expected_xml = xml(
             "w:body/("
-            "  w:p/w:pPr/w:sectPr/w:type{w:val=foobar},"
+            "  w:p/w:pPr/w:sectPr/(w:headerReference,w:type{w:val=foobar},w:footerReference),"
             "  w:sectPr/w:type{w:val=foobar}"
             ")"
         )
@@ -66,6 +66,16 @@ class DescribeParseXml:
         with pytest.raises(ValueError, match="Unicode strings with encoding declara"):
             parse_xml(xml_text)
 
+    def it_can_parse_xml_having_a_very_large_text_node(self):
+        text = "x" * 10000001
+        element = parse_xml(("<foo>%s</foo>" % text).encode("utf-8"))
+        assert element.text == text
+
+    def it_can_parse_a_str_whose_multibyte_text_node_is_very_large_once_encoded(self):
+        text = "é" * 6000000
+        element = parse_xml("<foo>%s</foo>" % text)
+        assert element.text == text
+
     def it_uses_registered_element_classes(self, xml_bytes):
         register_element_cls("a:foo", CustElmCls)
         element = parse_xml(xml_bytes)
@@ -0,0 +1,119 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit-test suite for `docx.oxml.coreprops` module."""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any, cast
+
+import pytest
+
+from docx.oxml.coreprops import CT_CoreProperties
+from docx.oxml.ns import nsdecls, nsmap, qn
+from docx.oxml.parser import parse_xml
+
+
+class DescribeCT_CoreProperties:
+    """Unit-test suite for selected units of `docx.oxml.coreprops.CT_CoreProperties`."""
+
+    @pytest.mark.parametrize(
+        ("w3cdtf_str", "expected_value"),
+        [
+            ("2003", dt.datetime(2003, 1, 1, tzinfo=dt.timezone.utc)),
+            ("2003-12", dt.datetime(2003, 12, 1, tzinfo=dt.timezone.utc)),
+            ("2003-12-31", dt.datetime(2003, 12, 31, tzinfo=dt.timezone.utc)),
+            ("2003-12-31T10:14:55Z", dt.datetime(2003, 12, 31, 10, 14, 55, tzinfo=dt.timezone.utc)),
+            (
+                "2003-12-31T10:14:55-08:00",
+                dt.datetime(2003, 12, 31, 18, 14, 55, tzinfo=dt.timezone.utc),
+            ),
+            (
+                "2003-12-31T10:14:55+02:30",
+                dt.datetime(2003, 12, 31, 7, 44, 55, tzinfo=dt.timezone.utc),
+            ),
+            ("2003-1-5", dt.datetime(2003, 1, 5, tzinfo=dt.timezone.utc)),
+            ("2003-12-1T1:2:3", dt.datetime(2003, 12, 1, 1, 2, 3, tzinfo=dt.timezone.utc)),
+        ],
+    )
+    def it_can_parse_a_W3CDTF_datetime_string(self, w3cdtf_str: str, expected_value: dt.datetime):
+        assert CT_CoreProperties._parse_W3CDTF_to_datetime(w3cdtf_str) == expected_value
+
+    @pytest.mark.parametrize(
+        "w3cdtf_str",
+        [
+            "",
+            "03",
+            "2003-13",
+            "2003/12/31",
+            "2003-02-30",
+            "2003-12-31T10:14",
+            "2003-12-31T25:00:00Z",
+        ],
+    )
+    def it_raises_on_an_invalid_W3CDTF_datetime_string(self, w3cdtf_str: str):
+        with pytest.raises(ValueError, match="could not parse W3CDTF datetime string"):
+            CT_CoreProperties._parse_W3CDTF_to_datetime(w3cdtf_str)
+
+    @pytest.mark.parametrize("nsdecl_pfxs", [("cp", "dcterms"), ("cp", "dcterms", "xsi")])
+    def it_declares_xsi_on_the_root_when_it_sets_created(self, nsdecl_pfxs: tuple[str, ...]):
+        coreProperties = cast(
+            CT_CoreProperties, parse_xml("<cp:coreProperties %s/>" % nsdecls(*nsdecl_pfxs))
+        )
+
+        coreProperties.created_datetime = dt.datetime(2001, 2, 3, 4, 5)
+
+        assert coreProperties.nsmap["xsi"] == nsmap["xsi"]
+        assert coreProperties.xml.count("xmlns:xsi=") == 1
+        assert coreProperties.created.get(qn("xsi:type")) == "dcterms:W3CDTF"
+        assert coreProperties.get(qn("xsi:foo")) is None
+
+    @pytest.mark.parametrize(
+        ("value", "expected_text"),
+        [
+            (dt.datetime(2003, 12, 31, 10, 14, 55), "2003-12-31T10:14:55Z"),
+            (dt.datetime(999, 1, 2, 3, 4, 5, 678), "0999-01-02T03:04:05Z"),
+        ],
+    )
+    def it_writes_a_W3CDTF_datetime_string(self, value: dt.datetime, expected_text: str):
+        coreProperties = CT_CoreProperties.new()
+
+        coreProperties.modified_datetime = value
+
+        assert coreProperties.modified.text == expected_text
+
+    @pytest.mark.parametrize(("value", "expected_text"), [("foobar", "foobar"), (1.2, "1.2")])
+    def it_stores_the_str_value_of_a_text_property(self, value: Any, expected_text: str):
+        coreProperties = CT_CoreProperties.new()
+
+        coreProperties.version_text = value
+
+        assert coreProperties.version_text == expected_text
+
+    def it_does_not_add_an_xsi_type_to_lastPrinted(self):
+        coreProperties = CT_CoreProperties.new()
+
+        coreProperties.lastPrinted_datetime = dt.datetime(2001, 2, 3, 4, 5)
+
+        assert coreProperties.lastPrinted.text == "2001-02-03T04:05:00Z"
+        assert coreProperties.lastPrinted.get(qn("xsi:type")) is None
+
+    def it_declares_xsi_on_a_new_coreProperties_element(self):
+        coreProperties = CT_CoreProperties.new()
+        assert coreProperties.nsmap["xsi"] == nsmap["xsi"]
+
+    @pytest.mark.parametrize(
+        ("offset_str", "expected_value"),
+        [
+            ("-07:00", dt.datetime(2003, 1, 1, 7)),
+            ("+05:30", dt.datetime(2002, 12, 31, 18, 30)),
+            ("+00:00", dt.datetime(2003, 1, 1)),
+        ],
+    )
+    def it_can_apply_a_timezone_offset(self, offset_str: str, expected_value: dt.datetime):
+        assert CT_CoreProperties._offset_dt(dt.datetime(2003, 1, 1), offset_str) == expected_value
+
+    @pytest.mark.parametrize("offset_str", ["", "-07", "07:00", "*07:00", "-07-00", "-0a:00"])
+    def it_raises_on_an_invalid_timezone_offset(self, offset_str: str):
+        with pytest.raises(ValueError, match="is not a valid offset string"):
+            CT_CoreProperties._offset_dt(dt.datetime(2003, 1, 1), offset_str)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from docx.oxml.ns import NamespacePrefixedTag
+from docx.oxml.ns import NamespacePrefixedTag, qn
 
 
 class DescribeNamespacePrefixedTag:
@@ -51,3 +51,16 @@ class DescribeNamespacePrefixedTag:
     @pytest.fixture
     def nsptag_str(self, local_part):
         return "a:%s" % local_part
+
+
+class Describe_qn:
+    def it_converts_a_namespace_prefixed_tag_to_a_clark_name(self):
+        assert qn("w:p") == "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p"
+
+    @pytest.mark.parametrize("tag", ["foobar", "w:a:b"])
+    def it_raises_on_a_tag_that_is_not_namespace_prefixed(self, tag: str):
+        with pytest.raises(ValueError, match="expected a namespace-prefixed tag like 'w:p'"):
+            qn(tag)
+
+    def it_returns_the_same_str_for_a_repeated_tag(self):
+        assert qn("w:tbl") is qn("w:tbl")
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from typing import cast
 
-from docx.oxml.section import CT_HdrFtr
+import pytest
+
+from docx.oxml.section import CT_HdrFtr, CT_SectPr
 from docx.oxml.table import CT_Tbl
 from docx.oxml.text.paragraph import CT_P
 
@@ -17,3 +19,54 @@ class DescribeCT_HdrFtr:
     def it_knows_its_inner_content_block_item_elements(self):
         hdr = cast(CT_HdrFtr, element("w:hdr/(w:tbl,w:tbl,w:p)"))
         assert [type(e) for e in hdr.inner_content_elements] == [CT_Tbl, CT_Tbl, CT_P]
+
+
+class DescribeCT_SectPr:
+    """Unit-test suite for selected units of `docx.oxml.section.CT_SectPr`."""
+
+    @pytest.mark.parametrize(
+        ("body_cxml", "sectPr_idx", "expected_idx"),
+        [
+            ("w:body/w:sectPr", 0, None),
+            ("w:body/(w:p/w:pPr/w:sectPr,w:sectPr)", 0, None),
+            ("w:body/(w:p/w:pPr/w:sectPr,w:sectPr)", 1, 0),
+            ("w:body/(w:p/w:pPr/w:sectPr,w:p,w:tbl,w:p/w:pPr,w:sectPr)", 1, 0),
+            ("w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:p,w:sectPr)", 1, 0),
+            ("w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:p,w:sectPr)", 2, 1),
+        ],
+    )
+    def it_knows_the_sectPr_that_precedes_it(
+        self, body_cxml: str, sectPr_idx: int, expected_idx: int | None
+    ):
+        sectPrs = cast("list[CT_SectPr]", element(body_cxml).xpath(".//w:sectPr"))
+        sectPr = sectPrs[sectPr_idx]
+
+        preceding_sectPr = sectPr.preceding_sectPr
+
+        assert preceding_sectPr is (None if expected_idx is None else sectPrs[expected_idx])
+
+    @pytest.mark.parametrize(
+        ("body_cxml", "sectPr_idx", "expected_child_idxs"),
+        [
+            ("w:body/w:sectPr", 0, []),
+            ("w:body/(w:p,w:tbl,w:sectPr)", 0, [0, 1]),
+            ("w:body/(w:p/w:pPr/w:sectPr,w:sectPr)", 0, [0]),
+            ("w:body/(w:p/w:pPr/w:sectPr,w:sectPr)", 1, []),
+            ("w:body/(w:p,w:tbl,w:p/w:pPr/w:sectPr,w:tbl,w:p,w:sectPr)", 0, [0, 1, 2]),
+            ("w:body/(w:p,w:tbl,w:p/w:pPr/w:sectPr,w:tbl,w:p,w:sectPr)", 1, [3, 4]),
+            (
+                "w:body/(w:p/w:pPr/w:sectPr,w:bookmarkStart,w:tbl,w:p/w:pPr/w:sectPr,w:sectPr)",
+                1,
+                [2, 3],
+            ),
+        ],
+    )
+    def it_can_iterate_the_block_items_in_its_section(
+        self, body_cxml: str, sectPr_idx: int, expected_child_idxs: list[int]
+    ):
+        body = element(body_cxml)
+        sectPr = cast("list[CT_SectPr]", body.xpath(".//w:sectPr"))[sectPr_idx]
+
+        blocks = list(sectPr.iter_inner_content())
+
+        assert blocks == [body[idx] for idx in expected_child_idxs]
@@ -0,0 +1,23 @@
+"""Unit-test suite for `docx.oxml.shape` module."""
+
+from __future__ import annotations
+
+from docx.oxml.shape import CT_Inline
+from docx.shared import Emu
+
+
+class DescribeCT_Inline:
+    """Unit-test suite for selected units of `docx.oxml.shape.CT_Inline`."""
+
+    def it_creates_each_new_pic_inline_as_an_independent_element(self):
+        inline_1 = CT_Inline.new_pic_inline(1, "rId1", "a.png", Emu(100), Emu(200))
+        inline_2 = CT_Inline.new_pic_inline(2, "rId2", "b.png", Emu(300), Emu(400))
+
+        assert inline_1 is not inline_2
+        assert inline_1.graphic.graphicData.pic is not inline_2.graphic.graphicData.pic
+        assert (inline_1.docPr.id, inline_1.docPr.name) == (1, "Picture 1")
+        assert (inline_2.docPr.id, inline_2.docPr.name) == (2, "Picture 2")
+        assert inline_1.graphic.graphicData.pic.blipFill.blip.embed == "rId1"
+        assert inline_2.graphic.graphicData.pic.blipFill.blip.embed == "rId2"
+        assert (inline_1.extent.cx, inline_1.extent.cy) == (100, 200)
+        assert (inline_2.extent.cx, inline_2.extent.cy) == (300, 400)
@@ -0,0 +1,61 @@
+"""Unit-test suite for `docx.oxml.simpletypes` module."""
+
+from __future__ import annotations
+
+from typing import Type
+
+import pytest
+
+from docx.oxml.simpletypes import (
+    BaseSimpleType,
+    ST_Coordinate,
+    ST_HexColor,
+    ST_HpsMeasure,
+    ST_SignedTwipsMeasure,
+    ST_TwipsMeasure,
+)
+from docx.shared import RGBColor
+
+
+class DescribeMeasureTypes:
+    """Unit-test suite for simple types that accept a universal measure."""
+
+    @pytest.mark.parametrize(
+        ("simple_type", "str_value", "expected_value"),
+        [
+            (ST_Coordinate, "914400", 914400),
+            (ST_Coordinate, "-12700", -12700),
+            (ST_Coordinate, "1in", 914400),
+            (ST_Coordinate, "2.54cm", 914400),
+            (ST_TwipsMeasure, "1440", 914400),
+            (ST_TwipsMeasure, "72pt", 914400),
+            (ST_TwipsMeasure, "6pc", 914400),
+            (ST_TwipsMeasure, "6pi", 914400),
+            (ST_TwipsMeasure, "25.4mm", 914400),
+            (ST_SignedTwipsMeasure, "-1440", -914400),
+            (ST_SignedTwipsMeasure, "-1in", -914400),
+            (ST_HpsMeasure, "24", 152400),
+            (ST_HpsMeasure, "12pt", 152400),
+        ],
+    )
+    def it_converts_an_xml_value_to_EMU(
+        self, simple_type: Type[BaseSimpleType], str_value: str, expected_value: int
+    ):
+        assert simple_type.from_xml(str_value) == expected_value
+
+
+class DescribeST_HexColor:
+    """Unit-test suite for `docx.oxml.simpletypes.ST_HexColor`."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected_value"),
+        [
+            (RGBColor(0x00, 0x00, 0x00), "000000"),
+            (RGBColor(0x0A, 0xBC, 0xFF), "0ABCFF"),
+            (RGBColor(0xFF, 0x01, 0x10), "FF0110"),
+        ],
+    )
+    def it_converts_an_RGBColor_to_an_uppercase_hex_string(
+        self, value: RGBColor, expected_value: str
+    ):
+        assert ST_HexColor.convert_to_xml(value) == expected_value
@@ -14,6 +14,43 @@ class DescribeCT_Styles:
         assert styles.xml == expected_xml
         assert style is styles[-1]
 
+    def it_can_get_a_style_by_a_name_containing_a_quote(self):
+        styles = element("w:styles")
+        style = styles.add_style_of_type('Quote "Big"', WD_STYLE_TYPE.PARAGRAPH, False)
+
+        assert styles.get_by_name('Quote "Big"') is style
+        assert styles.get_by_id(style.styleId) is style
+        assert styles.get_by_name("Quote") is None
+
+    @pytest.mark.parametrize(
+        ("styles_cxml", "style_type", "expected_styleId"),
+        [
+            ("w:styles", WD_STYLE_TYPE.PARAGRAPH, None),
+            ("w:styles/w:style{w:type=paragraph,w:styleId=A}", WD_STYLE_TYPE.PARAGRAPH, None),
+            (
+                "w:styles/(w:style{w:type=paragraph,w:default=1,w:styleId=A},"
+                "w:style{w:type=paragraph,w:default=1,w:styleId=B},"
+                "w:style{w:type=character,w:default=1,w:styleId=C})",
+                WD_STYLE_TYPE.PARAGRAPH,
+                "B",
+            ),
+            (
+                "w:styles/(w:style{w:type=table,w:default=1,w:styleId=A},"
+                "w:style{w:type=paragraph,w:default=1,w:styleId=B})",
+                WD_STYLE_TYPE.TABLE,
+                "A",
+            ),
+        ],
+    )
+    def it_can_find_the_default_style_for_a_style_type(
+        self, styles_cxml, style_type, expected_styleId
+    ):
+        styles = element(styles_cxml)
+
+        style = styles.default_for(style_type)
+
+        assert (None if style is None else style.styleId) == expected_styleId
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(
@@ -41,6 +41,22 @@ class DescribeCT_Row:
             tr.tc_at_grid_offset(col_idx)
 
 
+class DescribeCT_Tbl:
+
+    def it_generates_its_cells_row_by_row_skipping_nested_tables(self):
+        tbl = cast(
+            CT_Tbl,
+            element(
+                'w:tbl/(w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/w:tbl/w:tr/w:tc/w:p/w:r/w:t"x")'
+                ',w:tr/w:tc/w:p/w:r/w:t"b")'
+            ),
+        )
+
+        tcs = list(tbl.iter_tcs())
+
+        assert [tc.xpath("string(w:p)") for tc in tcs] == ["a", "", "b"]
+
+
 class DescribeCT_Tc:
     """Unit-test suite for `docx.oxml.table.CT_Tc` objects."""
 
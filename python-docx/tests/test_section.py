@@ -777,8 +777,8 @@ class Describe_Footer:
     def it_provides_access_to_the_prior_Footer_to_help(
         self, request: FixtureRequest, document_part_: Mock, footer_: Mock
     ):
-        doc_elm = element("w:document/(w:sectPr,w:sectPr)")
-        prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        doc_elm = cast(CT_Document, element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)"))
+        prior_sectPr, sectPr = doc_elm.sectPr_lst
         footer = _Footer(sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
         # ---mock must occur after construction of "real" footer---
         _Footer_ = class_mock(request, "docx.section._Footer", return_value=footer_)
@@ -868,8 +868,8 @@ class Describe_Header:
     def it_provides_access_to_the_prior_Header_to_help(
         self, request, document_part_: Mock, header_: Mock
     ):
-        doc_elm = element("w:document/(w:sectPr,w:sectPr)")
-        prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        doc_elm = cast(CT_Document, element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)"))
+        prior_sectPr, sectPr = doc_elm.sectPr_lst
         header = _Header(sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY)
         # ---mock must occur after construction of "real" header---
         _Header_ = class_mock(request, "docx.section._Header", return_value=header_)